@@ -36,6 +36,9 @@ a = Analysis(
     hiddenimports=[
         'webview',
         'ouroboros.config',
+        'ouroboros.login_path',
+        'ouroboros.port_probe',
+        'ouroboros.world_profiler',
     ],
     hookspath=[],
     hooksconfig={},
@@ -13,12 +13,13 @@ Responsibilities:
   - Handle restart signals (agent exits with code 42)
 """
 
+import atexit
 import json
 import importlib
 import logging
-import multiprocessing
 import os
 import pathlib
+import queue
 import shutil
 import subprocess
 import sys
@@ -49,6 +50,7 @@ load_settings = cast(Any, _config_module.load_settings)
 save_settings = cast(Any, _config_module.save_settings)
 acquire_pid_lock = cast(Any, _config_module.acquire_pid_lock)
 release_pid_lock = cast(Any, _config_module.release_pid_lock)
+pids_listening_on_port = cast(Any, importlib.import_module("ouroboros.port_probe").pids_listening_on_port)
 MAX_CRASH_RESTARTS = 5
 CRASH_WINDOW_SEC = 120
 
@@ -59,7 +61,7 @@ _LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 _log_dir = DATA_DIR / "logs"
 _log_dir.mkdir(parents=True, exist_ok=True)
 
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 _file_handler = RotatingFileHandler(
     _log_dir / "launcher.log", maxBytes=2 * 1024 * 1024, backupCount=2, encoding="utf-8",
@@ -67,8 +69,19 @@ _file_handler = RotatingFileHandler(
 _file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
 _handlers: list = [_file_handler]
 if not getattr(sys, "frozen", False):
-    _handlers.append(logging.StreamHandler())
-logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT, handlers=_handlers)
+    _stream_handler = logging.StreamHandler()
+    _stream_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    _handlers.append(_stream_handler)
+# Records are handed to a listener thread that owns the (locking, rotating)
+# file handler, so log calls on the lifecycle loop never wait on disk I/O.
+_log_listener = QueueListener(queue.Queue(-1), *_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = QueueHandler(_log_listener.queue)
+# prepare() bakes the formatted text into record.msg; keep it bare so only the
+# listener's handlers apply _LOG_FORMAT.
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 log = logging.getLogger("launcher")
 
 
@@ -106,7 +119,33 @@ def _find_embedded_python() -> str:
     return sys.executable
 
 
-EMBEDDED_PYTHON = _find_embedded_python()
+_EMBEDDED_PYTHON_CACHE = DATA_DIR / "state" / "embedded_python.path"
+
+
+def _resolve_embedded_python() -> str:
+    """_find_embedded_python(), memoized on disk per app version / bundle location."""
+    # sys.executable is the dev-mode fallback, so a different venv must miss the cache
+    key = (f"{APP_VERSION}|frozen={bool(getattr(sys, 'frozen', False))}"
+           f"|{_bundle_root()}|{sys.executable}")
+    try:
+        cached = json.loads(_EMBEDDED_PYTHON_CACHE.read_text(encoding="utf-8"))
+        if cached.get("key") == key and os.path.exists(cached.get("path") or ""):
+            return str(cached["path"])
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    path = _find_embedded_python()
+    try:
+        _EMBEDDED_PYTHON_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _EMBEDDED_PYTHON_CACHE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"key": key, "path": path}), encoding="utf-8")
+        os.replace(tmp, _EMBEDDED_PYTHON_CACHE)
+    except OSError as e:
+        log.debug("Could not cache embedded python path: %s", e)
+    return path
+
+
+EMBEDDED_PYTHON = _resolve_embedded_python()
 
 
 # ---------------------------------------------------------------------------
@@ -116,35 +155,66 @@ def check_git() -> bool:
     return shutil.which("git") is not None
 
 
-def _sync_core_files() -> None:
-    """Sync core files from bundle to REPO_DIR on every launch."""
+_SYNC_PATHS = (
+    "ouroboros/safety.py",
+    "prompts/SAFETY.md",
+    "ouroboros/tools/registry.py",
+)
+
+
+def _fast_copy(src, dst) -> None:
+    """copy2 via the OS-native file copy where shutil doesn't already use one.
+
+    shutil.copyfile already uses sendfile (Linux) and fcopyfile (macOS); on
+    Windows it falls back to a read/write loop, so call CopyFileW directly.
+    """
+    if sys.platform == "win32":
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+def _same_bytes(a: pathlib.Path, b: pathlib.Path) -> bool:
+    try:
+        if a.stat().st_size != b.stat().st_size:
+            return False
+        # Full compare, not mtime: the agent must not be able to keep an edited
+        # protected file just by leaving it newer than the bundle copy.
+        return a.read_bytes() == b.read_bytes()
+    except OSError:
+        return False
+
+
+def _sync_core_files() -> list[str]:
+    """Sync core files from bundle to REPO_DIR on every launch; returns the paths rewritten."""
     bundle_dir = _bundle_root()
 
-    sync_paths = [
-        "ouroboros/safety.py",
-        "prompts/SAFETY.md",
-        "ouroboros/tools/registry.py",
-    ]
-    for rel in sync_paths:
+    changed = []
+    for rel in _SYNC_PATHS:
         src = bundle_dir / rel
         dst = REPO_DIR / rel
-        if src.exists():
+        if src.exists() and not _same_bytes(src, dst):
             dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-    log.info("Synced %d core files to %s", len(sync_paths), REPO_DIR)
+            _fast_copy(src, dst)
+            changed.append(rel)
+    log.info("Synced %d/%d core files to %s", len(changed), len(_SYNC_PATHS), REPO_DIR)
+    return changed
 
 
-def _commit_synced_files() -> None:
+def _commit_synced_files(changed: list[str]) -> None:
     """Commit sync'd safety files so git reset --hard doesn't revert them."""
+    if not changed:
+        return
     try:
-        for rel in ["ouroboros/safety.py", "prompts/SAFETY.md", "ouroboros/tools/registry.py"]:
-            subprocess.run(["git", "add", rel], cwd=str(REPO_DIR),
-                           check=False, capture_output=True)
-        status = subprocess.run(["git", "status", "--porcelain", "--",
-                                 "ouroboros/safety.py", "prompts/SAFETY.md",
-                                 "ouroboros/tools/registry.py"],
-                                cwd=str(REPO_DIR), capture_output=True, text=True)
-        if status.stdout.strip():
+        # One `git add` for all rewritten paths
+        subprocess.run(["git", "add", "--", *changed], cwd=str(REPO_DIR),
+                       check=False, capture_output=True)
+        # Exit status only (1 = staged changes), no porcelain output to parse
+        staged = subprocess.run(["git", "diff-index", "--quiet", "--cached", "HEAD", "--", *changed],
+                                cwd=str(REPO_DIR), capture_output=True)
+        if staged.returncode != 0:
             subprocess.run(["git", "commit", "-m",
                             "safety-sync: restore protected files from bundle"],
                            cwd=str(REPO_DIR), check=False, capture_output=True)
@@ -193,21 +263,67 @@ Thumbs.db
 .release_notes.md
 python-standalone/
 """
+_REPO_GITIGNORE_BYTES = _REPO_GITIGNORE.encode("utf-8")
 
 
 def _ensure_repo_gitignore(repo_dir: pathlib.Path) -> None:
     """Write .gitignore if missing — MUST run before any git add -A."""
     gi = repo_dir / ".gitignore"
     if not gi.exists():
-        gi.write_text(_REPO_GITIGNORE, encoding="utf-8")
+        gi.write_bytes(_REPO_GITIGNORE_BYTES)
+
+
+_BOOTSTRAP_IGNORE = (
+    "repo", "data", "build", "dist", ".git", "__pycache__", "venv", ".venv",
+    "Ouroboros.spec", "run_demo.sh", "demo_app.py", "app.py", "launcher.py",
+    "colab_launcher.py", "colab_bootstrap_shim.py",
+    "python-standalone", "assets",
+    "*.pyc", "*.pyo", "*.so", "*.dylib", "*.dll",
+    "*.dist-info", "base_library.zip",
+)
+
+
+def _copy_tree_parallel(src: pathlib.Path, dst: pathlib.Path, ignore: tuple) -> None:
+    """copytree replacement for first-run bootstrap (`ignore` = ignore_patterns globs).
+
+    Uses multithreaded robocopy on Windows; elsewhere (or if robocopy fails)
+    creates directories serially and copies files on a thread pool.
+    """
+    if sys.platform == "win32" and shutil.which("robocopy"):
+        # robocopy /XD and /XF match names at every depth, like ignore_patterns
+        res = subprocess.run(
+            ["robocopy", str(src), str(dst), "/E", "/MT:16", "/SL",
+             "/NFL", "/NDL", "/NJH", "/NJS", "/NP",
+             "/XD", *ignore, "/XF", *ignore],
+            capture_output=True,
+        )
+        if res.returncode < 8:  # 0-7 are success codes
+            return
+        log.warning("robocopy failed (exit %d), falling back to threaded copy", res.returncode)
+
+    import fnmatch
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _ignored(name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pat) for pat in ignore)
+
+    files = []
+    for dirpath, dirnames, filenames in os.walk(src):
+        dirnames[:] = [d for d in dirnames if not _ignored(d)]
+        target = dst / os.path.relpath(dirpath, src)
+        os.makedirs(target, exist_ok=True)
+        files.extend((os.path.join(dirpath, f), target / f) for f in filenames if not _ignored(f))
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        # list() re-raises the first copy error, as copytree would
+        list(pool.map(lambda pair: _fast_copy(*pair), files))
 
 
 def bootstrap_repo() -> None:
     """Copy bundled codebase to REPO_DIR on first run, sync core files always."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     if REPO_DIR.exists() and (REPO_DIR / "server.py").exists():
-        _sync_core_files()
-        _commit_synced_files()
+        _commit_synced_files(_sync_core_files())
         return
 
     needs_full_bootstrap = not REPO_DIR.exists()
@@ -216,23 +332,18 @@ def bootstrap_repo() -> None:
     bundle_dir = _bundle_root()
 
     if needs_full_bootstrap:
-        shutil.copytree(bundle_dir, REPO_DIR, ignore=shutil.ignore_patterns(
-            "repo", "data", "build", "dist", ".git", "__pycache__", "venv", ".venv",
-            "Ouroboros.spec", "run_demo.sh", "demo_app.py", "app.py", "launcher.py",
-            "colab_launcher.py", "colab_bootstrap_shim.py",
-            "python-standalone", "assets",
-            "*.pyc", "*.pyo", "*.so", "*.dylib", "*.dll",
-            "*.dist-info", "base_library.zip",
-        ))
+        _copy_tree_parallel(bundle_dir, REPO_DIR, _BOOTSTRAP_IGNORE)
     else:
-        for item in ("server.py", "web"):
+        # Restore only top-level items that are missing entirely; directories
+        # go through the same parallel copier as the full bootstrap.
+        missing = [item for item in ("server.py", "web")
+                   if (bundle_dir / item).exists() and not (REPO_DIR / item).exists()]
+        for item in missing:
             src = bundle_dir / item
-            dst = REPO_DIR / item
-            if src.exists() and not dst.exists():
-                if src.is_dir():
-                    shutil.copytree(src, dst)
-                else:
-                    shutil.copy2(src, dst)
+            if src.is_dir():
+                _copy_tree_parallel(src, REPO_DIR / item, ())
+            else:
+                _fast_copy(src, REPO_DIR / item)
 
     # Initialize git repo if new
     if needs_full_bootstrap:
@@ -248,30 +359,57 @@ def bootstrap_repo() -> None:
         except Exception as e:
             log.error("Git init failed: %s", e)
 
-    # Generate world profile
+    # World profiling only shells out to stdlib probes, so it runs alongside the
+    # pip install instead of ahead of it.
+    profiler = threading.Thread(target=_generate_world_profile, daemon=True)
+    profiler.start()
+
+    # Migrate old settings if needed
+    _migrate_old_settings()
+
+    # Install dependencies
+    _install_deps()
+    profiler.join(timeout=30)
+    log.info("Bootstrap complete.")
+
+
+def _generate_world_profile() -> None:
+    """Write memory/WORLD.md if it does not exist yet.
+
+    world_profiler is stdlib-only and probes the OS, not the interpreter, so it
+    runs in-process (bundled copy) instead of paying an embedded-Python startup.
+    """
     try:
         memory_dir = DATA_DIR / "memory"
         memory_dir.mkdir(parents=True, exist_ok=True)
         world_path = memory_dir / "WORLD.md"
         if not world_path.exists():
-            env = os.environ.copy()
-            env["PYTHONPATH"] = str(REPO_DIR)
-            subprocess.run(
-                [EMBEDDED_PYTHON, "-c",
-                 f"import sys; sys.path.insert(0, '{REPO_DIR}'); "
-                 f"from ouroboros.world_profiler import generate_world_profile; "
-                 f"generate_world_profile('{world_path}')"],
-                env=env, timeout=30, capture_output=True,
-            )
+            profiler = importlib.import_module("ouroboros.world_profiler")
+            profiler.generate_world_profile(str(world_path))
     except Exception as e:
         log.warning("World profile generation failed: %s", e)
 
-    # Migrate old settings if needed
-    _migrate_old_settings()
 
-    # Install dependencies
-    _install_deps()
-    log.info("Bootstrap complete.")
+_MIGRATE_ENV_KEYS = (
+    "OPENROUTER_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY",
+    "OUROBOROS_MODEL", "OUROBOROS_MODEL_CODE", "OUROBOROS_MODEL_LIGHT",
+    "OUROBOROS_MODEL_FALLBACK", "TOTAL_BUDGET", "OUROBOROS_MAX_WORKERS",
+    "OUROBOROS_SOFT_TIMEOUT_SEC", "OUROBOROS_HARD_TIMEOUT_SEC",
+    "GITHUB_TOKEN", "GITHUB_REPO",
+)
+_MIGRATE_FLOAT_KEYS = frozenset({"TOTAL_BUDGET"})
+_MIGRATE_INT_KEYS = frozenset({"OUROBOROS_MAX_WORKERS", "OUROBOROS_SOFT_TIMEOUT_SEC", "OUROBOROS_HARD_TIMEOUT_SEC"})
+
+
+def _coerce_env_setting(key: str, val: str) -> Any:
+    try:
+        if key in _MIGRATE_FLOAT_KEYS:
+            return float(val)
+        if key in _MIGRATE_INT_KEYS:
+            return int(val)
+    except (ValueError, TypeError):
+        pass
+    return val
 
 
 def _migrate_old_settings() -> None:
@@ -279,33 +417,16 @@ def _migrate_old_settings() -> None:
     if SETTINGS_PATH.exists():
         return
 
-    migrated: dict[str, Any] = {}
-    env_keys = [
-        "OPENROUTER_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY",
-        "OUROBOROS_MODEL", "OUROBOROS_MODEL_CODE", "OUROBOROS_MODEL_LIGHT",
-        "OUROBOROS_MODEL_FALLBACK", "TOTAL_BUDGET", "OUROBOROS_MAX_WORKERS",
-        "OUROBOROS_SOFT_TIMEOUT_SEC", "OUROBOROS_HARD_TIMEOUT_SEC",
-        "GITHUB_TOKEN", "GITHUB_REPO",
-    ]
-    for key in env_keys:
-        val = os.environ.get(key, "")
-        if val:
-            try:
-                if key in ("TOTAL_BUDGET",):
-                    migrated[key] = float(val)
-                elif key in ("OUROBOROS_MAX_WORKERS", "OUROBOROS_SOFT_TIMEOUT_SEC", "OUROBOROS_HARD_TIMEOUT_SEC"):
-                    migrated[key] = int(val)
-                else:
-                    migrated[key] = val
-            except (ValueError, TypeError):
-                migrated[key] = val
+    migrated: dict[str, Any] = {
+        k: _coerce_env_setting(k, v) for k in _MIGRATE_ENV_KEYS if (v := os.environ.get(k))
+    }
 
-    # Also check for old settings.json in data/state/
+    # Also check for old settings.json in data/state/ (not needed if env covered every key)
     old_settings = DATA_DIR / "state" / "settings.json"
-    if old_settings.exists():
+    if len(migrated) < len(_MIGRATE_ENV_KEYS) and old_settings.exists():
         try:
             old = json.loads(old_settings.read_text(encoding="utf-8"))
-            for key in env_keys:
+            for key in _MIGRATE_ENV_KEYS:
                 if key in old and key not in migrated:
                     migrated[key] = old[key]
         except Exception:
@@ -317,17 +438,43 @@ def _migrate_old_settings() -> None:
         log.info("Migrated %d settings to %s", len(migrated), SETTINGS_PATH)
 
 
+_DEPS_HASH_FILE = DATA_DIR / "state" / "deps.hash"
+
+
+def _deps_key(req_file: pathlib.Path) -> str:
+    """requirements.txt content + interpreter identity (re-bundling re-runs pip)."""
+    import hashlib
+    h = hashlib.sha256(req_file.read_bytes())
+    try:
+        h.update(f"|{EMBEDDED_PYTHON}|{os.stat(EMBEDDED_PYTHON).st_mtime_ns}".encode("utf-8"))
+    except OSError:
+        h.update(f"|{EMBEDDED_PYTHON}".encode("utf-8"))
+    return h.hexdigest()
+
+
 def _install_deps() -> None:
-    """Install Python dependencies for the agent."""
+    """Install Python dependencies for the agent (skipped if unchanged since last success)."""
     req_file = REPO_DIR / "requirements.txt"
     if not req_file.exists():
         return
+    try:
+        key = _deps_key(req_file)
+        if _DEPS_HASH_FILE.read_text(encoding="utf-8").strip() == key:
+            log.info("Agent dependencies unchanged, skipping pip install.")
+            return
+    except OSError:
+        pass
     log.info("Installing agent dependencies...")
     try:
-        subprocess.run(
+        res = subprocess.run(
             [EMBEDDED_PYTHON, "-m", "pip", "install", "-q", "-r", str(req_file)],
             timeout=300, capture_output=True,
         )
+        if res.returncode == 0:
+            _DEPS_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _DEPS_HASH_FILE.write_text(_deps_key(req_file), encoding="utf-8")
+        else:
+            log.warning("pip install exited with %d", res.returncode)
     except Exception as e:
         log.warning("Dependency install failed: %s", e)
 
@@ -340,21 +487,39 @@ _agent_lock = threading.Lock()
 _shutdown_event = threading.Event()
 
 
+# (settings.json stamp, env) — the agent env is rebuilt only when settings change
+_agent_env_cache: Optional[tuple[Optional[tuple[int, int]], dict]] = None
+
+
+def _agent_env(port: int) -> dict:
+    global _agent_env_cache
+    try:
+        st = SETTINGS_PATH.stat()
+        stamp: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    if _agent_env_cache is None or _agent_env_cache[0] != stamp:
+        env = os.environ.copy()
+        env["PYTHONPATH"] = str(REPO_DIR)
+        env["OUROBOROS_DATA_DIR"] = str(DATA_DIR)
+        env["OUROBOROS_REPO_DIR"] = str(REPO_DIR)
+        env["OUROBOROS_APP_VERSION"] = str(APP_VERSION)
+
+        # Pass settings as env vars
+        settings = _load_settings()
+        for key, val in settings.items():
+            if val:
+                env[key] = str(val)
+        _agent_env_cache = (stamp, env)
+    env = _agent_env_cache[1]
+    env["OUROBOROS_SERVER_PORT"] = str(port)  # the only per-start variable
+    return env
+
+
 def start_agent(port: int = AGENT_SERVER_PORT) -> subprocess.Popen:
     """Start the agent server.py as a subprocess."""
     global _agent_proc
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(REPO_DIR)
-    env["OUROBOROS_SERVER_PORT"] = str(port)
-    env["OUROBOROS_DATA_DIR"] = str(DATA_DIR)
-    env["OUROBOROS_REPO_DIR"] = str(REPO_DIR)
-    env["OUROBOROS_APP_VERSION"] = str(APP_VERSION)
-
-    # Pass settings as env vars
-    settings = _load_settings()
-    for key, val in settings.items():
-        if val:
-            env[key] = str(val)
+    env = _agent_env(port)
 
     server_py = REPO_DIR / "server.py"
     log.info("Starting agent: %s %s (port=%d)", EMBEDDED_PYTHON, server_py, port)
@@ -365,24 +530,29 @@ def start_agent(port: int = AGENT_SERVER_PORT) -> subprocess.Popen:
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
+        bufsize=0,
     )
     _agent_proc = proc
 
-    # Stream agent stdout to log file in background
+    # Stream agent stdout to log file in background: raw block reads appended
+    # as-is (no per-line decode, no flush — writes to a raw fd are unbuffered).
     def _stream_output():
         log_path = DATA_DIR / "logs" / "agent_stdout.log"
+        stdout_stream = proc.stdout
+        if stdout_stream is None:
+            return
         try:
-            with open(log_path, "a", encoding="utf-8") as f:
-                stdout_stream = proc.stdout
-                if stdout_stream is None:
-                    return
-                for line in iter(stdout_stream.readline, b""):
-                    if isinstance(line, bytes):
-                        decoded = line.decode("utf-8", errors="replace")
-                    else:
-                        decoded = str(line)
-                    f.write(decoded)
-                    f.flush()
+            src_fd = stdout_stream.fileno()
+            log_fd = os.open(str(log_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND
+                             | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                while True:
+                    buf = os.read(src_fd, 65536)
+                    if not buf:
+                        break
+                    os.write(log_fd, buf)
+            finally:
+                os.close(log_fd)
         except Exception:
             pass
 
@@ -420,104 +590,88 @@ def _read_port_file() -> int:
     return AGENT_SERVER_PORT
 
 
-def _pids_listening_on_port(port: int) -> set[int]:
-    pids: set[int] = set()
-    commands: list[list[str]] = []
-    if sys.platform == "win32":
-        commands = [["netstat", "-ano", "-p", "tcp"]]
-    else:
-        commands = [
-            ["lsof", "-ti", f"tcp:{port}"],
-            ["ss", "-ltnp"],
-        ]
-
-    for cmd in commands:
-        if shutil.which(cmd[0]) is None:
-            continue
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-        except Exception:
-            continue
-
-        out = result.stdout
-        if cmd[0] == "netstat":
-            for line in out.splitlines():
-                parts = line.split()
-                if len(parts) >= 5 and parts[1].endswith(f":{port}"):
-                    try:
-                        pids.add(int(parts[-1]))
-                    except ValueError:
-                        pass
-        elif cmd[0] == "lsof":
-            for pid_str in out.split():
-                try:
-                    pids.add(int(pid_str))
-                except ValueError:
-                    pass
-        else:  # ss
-            for line in out.splitlines():
-                if f":{port}" not in line:
-                    continue
-                pid_marker = "pid="
-                if pid_marker in line:
-                    tail = line.split(pid_marker, 1)[1]
-                    pid_digits = "".join(ch for ch in tail if ch.isdigit())
-                    if pid_digits:
-                        pids.add(int(pid_digits))
-
-        if pids:
-            break
-
-    return pids
+def _port_free(port: int) -> bool:
+    """True if nothing is bound to 127.0.0.1:*port* (a cheap bind probe)."""
+    import socket
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", port))
+        return True
+    except OSError:
+        return False
 
 
 def _kill_stale_on_port(port: int) -> None:
     """Kill any process listening on the given port (cleanup from previous runs)."""
-    for pid in _pids_listening_on_port(port):
-        if pid == os.getpid():
+    if _port_free(port):
+        return
+    for pid in pids_listening_on_port(port):
+        if pid <= 0 or pid == os.getpid():
             continue
         try:
-            if sys.platform == "win32":
-                subprocess.run(["taskkill", "/F", "/PID", str(pid)], check=False, capture_output=True)
-            else:
-                os.kill(pid, 9)
+            # On Windows os.kill() is TerminateProcess, i.e. taskkill /F without the spawn.
+            os.kill(pid, 9)
             log.info("Killed stale process %d on port %d", pid, port)
         except (ProcessLookupError, PermissionError, OSError):
             pass
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Startup poll interval: 25ms doubling up to 500ms, so fast boots are seen promptly."""
+    return min(0.5, 0.025 * 2 ** attempt)
+
+
 def _wait_for_server(port: int, timeout: float = 30.0) -> bool:
     """Wait for the agent HTTP server to become responsive."""
-    import urllib.request
-    url = f"http://127.0.0.1:{port}/api/health"
+    import http.client
+    # One keep-alive connection for all probes; rebuilt only after a failure.
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
     deadline = time.time() + timeout
-    while time.time() < deadline:
-        try:
-            with urllib.request.urlopen(url, timeout=2) as resp:
+    attempt = 0
+    try:
+        while time.time() < deadline:
+            try:
+                conn.request("GET", "/api/health")
+                resp = conn.getresponse()
+                resp.read()
                 if resp.status == 200:
                     return True
-        except Exception:
-            pass
-        time.sleep(0.5)
-    return False
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            time.sleep(_backoff_delay(attempt))
+            attempt += 1
+        return False
+    finally:
+        conn.close()
 
 
 def _poll_port_file(timeout: float = 30.0) -> int:
     """Poll port file until it's freshly written (mtime within last 10s)."""
     deadline = time.time() + timeout
+    attempt = 0
     while time.time() < deadline:
         try:
-            if PORT_FILE.exists():
-                age = time.time() - PORT_FILE.stat().st_mtime
-                if age < 10:
-                    return int(PORT_FILE.read_text(encoding="utf-8").strip())
+            age = time.time() - PORT_FILE.stat().st_mtime
+            if age < 10:
+                return int(PORT_FILE.read_text(encoding="utf-8").strip())
         except (ValueError, OSError):
             pass
-        time.sleep(0.5)
+        time.sleep(_backoff_delay(attempt))
+        attempt += 1
     return _read_port_file()
 
 
 _webview_window = None  # set by main(), used by lifecycle loop
+_WEBVIEW: Any = None
+
+
+def _webview() -> Any:
+    """pywebview, imported on first use and shared by the wizard and main window."""
+    global _WEBVIEW
+    if _WEBVIEW is None:
+        _WEBVIEW = importlib.import_module("webview")
+    return _WEBVIEW
 
 
 def agent_lifecycle_loop(port: int = AGENT_SERVER_PORT) -> None:
@@ -541,8 +695,15 @@ def agent_lifecycle_loop(port: int = AGENT_SERVER_PORT) -> None:
         if not _wait_for_server(actual_port, timeout=45):
             log.warning("Agent server did not become responsive within 45s (port %d)", actual_port)
 
-        proc.wait()
+        # Bounded waits so a window close is noticed within 0.5s instead of
+        # blocking until the child happens to exit on its own.
+        while proc.poll() is None:
+            if _shutdown_event.wait(timeout=0.5):
+                proc.terminate()
+                break
         exit_code = proc.returncode
+        if exit_code is None:  # terminated for shutdown; stop_agent() reaps it
+            break
         log.info("Agent exited with code %d", exit_code)
 
         with _agent_lock:
@@ -576,8 +737,7 @@ def agent_lifecycle_loop(port: int = AGENT_SERVER_PORT) -> None:
 
         if exit_code == RESTART_EXIT_CODE:
             log.info("Agent requested restart (exit code 42). Restarting...")
-            _sync_core_files()
-            _commit_synced_files()
+            _commit_synced_files(_sync_core_files())
             _install_deps()
             _kill_stale_on_port(port)
             continue
@@ -694,7 +854,7 @@ def _run_first_run_wizard() -> bool:
     if settings.get("OPENAI_COMPAT_API_KEY") or settings.get("OPENROUTER_API_KEY"):
         return True
 
-    webview = importlib.import_module("webview")
+    webview = _webview()
     _wizard_done = {"ok": False}
 
     class WizardApi:
@@ -727,10 +887,9 @@ def _run_first_run_wizard() -> bool:
 # Main
 # ---------------------------------------------------------------------------
 def main():
-    webview = importlib.import_module("webview")
-
     if not acquire_pid_lock():
         log.error("Another instance already running.")
+        webview = _webview()
         webview.create_window(
             "Ouroboros",
             html="<html><body style='background:#1a1a2e;color:white;font-family:system-ui;display:flex;align-items:center;justify-content:center;height:100vh;margin:0'>"
@@ -740,12 +899,12 @@ def main():
         webview.start()
         return
 
-    import atexit
     atexit.register(release_pid_lock)
 
     # Check git
     if not check_git():
         log.warning("Git not found.")
+        webview = _webview()
         _result = {"installed": False}
 
         def _git_page(window):
@@ -789,12 +948,18 @@ def main():
         if not check_git():
             sys.exit(1)
 
-    # Bootstrap
-    bootstrap_repo()
+    # Bootstrap (file copy, git init, pip install) runs while the wizard waits
+    # on the user; the wizard only needs migrated settings, which are cheap.
+    _migrate_old_settings()
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="bootstrap") as pool:
+        bootstrap_future = pool.submit(bootstrap_repo)
+        pool.submit(_webview)  # warm the GUI-toolkit import off the critical path
 
-    # First-run wizard (API key)
-    if not _run_first_run_wizard():
-        log.info("Wizard was closed without saving. Launching anyway (Settings page available).")
+        # First-run wizard (API key) — webview needs the main thread
+        if not _run_first_run_wizard():
+            log.info("Wizard was closed without saving. Launching anyway (Settings page available).")
+        bootstrap_future.result()
 
     global _webview_window
     port = AGENT_SERVER_PORT
@@ -803,16 +968,14 @@ def main():
     lifecycle_thread = threading.Thread(target=agent_lifecycle_loop, args=(port,), daemon=True)
     lifecycle_thread.start()
 
-    # Wait for server to be ready, then read actual port (may differ if default was busy)
-    _wait_for_server(port, timeout=15)
-    actual_port = _read_port_file()
-    if actual_port != port:
-        _wait_for_server(actual_port, timeout=45)
-    else:
-        _wait_for_server(port, timeout=45)
+    # The server writes its actual port (may differ if default was busy) before
+    # serving, so learn it first and probe health only on that port.
+    actual_port = _poll_port_file(timeout=15)
+    _wait_for_server(actual_port, timeout=45)
 
     url = f"http://127.0.0.1:{actual_port}"
 
+    webview = _webview()
     window = webview.create_window(
         f"Ouroboros v{APP_VERSION}",
         url=url,
@@ -829,6 +992,7 @@ def main():
         stop_agent()
         _kill_orphaned_children()
         release_pid_lock()
+        _log_listener.stop()  # os._exit skips atexit; flush queued log records
         os._exit(0)
 
     def _kill_orphaned_children():
@@ -840,6 +1004,7 @@ def main():
         """
         _kill_stale_on_port(port)
         _kill_stale_on_port(8766)
+        import multiprocessing
         import signal
         for child in multiprocessing.active_children():
             child_pid = child.pid
@@ -865,13 +1030,9 @@ if __name__ == "__main__":
     freeze_support()
 
     if sys.platform == "darwin":
-        try:
-            _shell_path = subprocess.check_output(
-                ["/bin/bash", "-l", "-c", "echo $PATH"], text=True, timeout=5,
-            ).strip()
-            if _shell_path:
-                os.environ["PATH"] = _shell_path
-        except Exception:
-            pass
+        _shell_path = importlib.import_module("ouroboros.login_path").login_shell_path(
+            DATA_DIR / "state" / "login_path.json")
+        if _shell_path:
+            os.environ["PATH"] = _shell_path
 
     main()
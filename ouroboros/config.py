@@ -7,6 +7,7 @@ Does not import anything from ouroboros.* (zero dependency level).
 
 from __future__ import annotations
 
+import functools
 import json
 import importlib
 import os
@@ -21,6 +22,11 @@ try:
 except ImportError:
     portalocker = None
 
+try:
+    orjson: ModuleType | None = importlib.import_module("orjson")
+except ImportError:
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -82,7 +88,9 @@ SettingsDict = dict[str, Any]
 # ---------------------------------------------------------------------------
 # Version
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def read_version() -> str:
+    # Cached: VERSION only changes with a code update, which restarts the process.
     try:
         if getattr(sys, "frozen", False):
             bundle_root = getattr(sys, "_MEIPASS", pathlib.Path(__file__).parent.parent)
@@ -97,52 +105,121 @@ def read_version() -> str:
 # ---------------------------------------------------------------------------
 # Settings file locking
 # ---------------------------------------------------------------------------
+# One persistent lock file for every process, locked with an OS advisory lock
+# (portalocker when installed, else fcntl/msvcrt on the same file so both kinds
+# of process exclude each other). Never unlinked: the OS drops the lock when
+# the holder exits, same as the PID lock below.
 _SETTINGS_LOCK = pathlib.Path(str(SETTINGS_PATH) + ".lock")
 
+SettingsLock = Optional[IO[str]]
 
-def _acquire_settings_lock(timeout: float = 2.0) -> Optional[int]:
-    start = time.time()
-    while time.time() - start < timeout:
+
+def _try_lock_settings(fh: IO[str]) -> bool:
+    """Non-blocking exclusive lock on *fh*; False if another process holds it."""
+    if portalocker is not None:
         try:
-            fd = os.open(str(_SETTINGS_LOCK), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
-            return fd
-        except FileExistsError:
-            try:
-                if time.time() - _SETTINGS_LOCK.stat().st_mtime > 10:
-                    _SETTINGS_LOCK.unlink()
-                    continue
-            except Exception:
-                pass
-            time.sleep(0.01)
+            cast(Any, getattr(portalocker, "lock"))(
+                fh, cast(int, getattr(portalocker, "LOCK_EX")) | cast(int, getattr(portalocker, "LOCK_NB")),
+            )
+            return True
         except Exception:
-            break
-    return None
+            return False
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
 
 
-def _release_settings_lock(fd: Optional[int]) -> None:
-    if fd is not None:
-        try:
-            os.close(fd)
-        except Exception:
-            pass
+def _acquire_settings_lock(timeout: float = 2.0) -> SettingsLock:
+    try:
+        _SETTINGS_LOCK.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(str(_SETTINGS_LOCK), "a+")
+    except OSError:
+        return None
+    deadline = time.monotonic() + timeout
+    while True:
+        if _try_lock_settings(fh):
+            return fh
+        if time.monotonic() >= deadline:
+            # Same as before: proceed unlocked rather than stall the caller.
+            fh.close()
+            return None
+        time.sleep(0.01)
+
+
+def _release_settings_lock(lock: SettingsLock) -> None:
+    if lock is None:
+        return
     try:
-        _SETTINGS_LOCK.unlink()
+        if portalocker is not None:
+            cast(Any, getattr(portalocker, "unlock"))(lock)
+        elif sys.platform == "win32":
+            import msvcrt
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
     except Exception:
         pass
+    lock.close()
 
 
 # ---------------------------------------------------------------------------
 # Load / Save
 # ---------------------------------------------------------------------------
+# Parsed settings keyed on the file's (mtime_ns, size): repeated loads (settings
+# page, agent restarts) skip the lock-file dance and JSON parse.
+_settings_cache: Optional[tuple[tuple[int, int], SettingsDict]] = None
+
+
+def _settings_stamp() -> Optional[tuple[int, int]]:
+    try:
+        st = SETTINGS_PATH.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _dumps_settings(settings: SettingsDict) -> bytes:
+    if orjson is not None:
+        try:
+            return cast(Any, orjson).dumps(settings, option=cast(Any, orjson).OPT_INDENT_2)
+        except TypeError:
+            pass  # orjson is stricter (e.g. non-str keys); let json handle it
+    return json.dumps(settings, indent=2).encode("utf-8")
+
+
+def _loads_settings(raw: bytes) -> Any:
+    if orjson is not None:
+        return cast(Any, orjson).loads(raw)
+    return json.loads(raw)
+
+
 def load_settings() -> SettingsDict:
+    global _settings_cache
+    stamp = _settings_stamp()
+    cached = _settings_cache
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return dict(cached[1])
+
     fd = _acquire_settings_lock()
     settings: SettingsDict = dict(SETTINGS_DEFAULTS)
     try:
         if SETTINGS_PATH.exists():
             try:
-                loaded = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+                loaded = _loads_settings(SETTINGS_PATH.read_bytes())
                 if isinstance(loaded, dict):
                     settings.update(loaded)
+                    if stamp is not None:
+                        _settings_cache = (stamp, dict(settings))
             except Exception:
                 pass
     finally:
@@ -152,40 +229,58 @@ def load_settings() -> SettingsDict:
 
 
 def save_settings(settings: SettingsDict) -> None:
+    global _settings_cache
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     fd = _acquire_settings_lock()
     try:
+        _settings_cache = None
+        payload = _dumps_settings(settings)
         try:
             tmp = SETTINGS_PATH.with_suffix(".tmp")
-            tmp.write_text(json.dumps(settings, indent=2), encoding="utf-8")
+            tmp.write_bytes(payload)
             os.replace(str(tmp), str(SETTINGS_PATH))
         except OSError:
-            SETTINGS_PATH.write_text(json.dumps(settings, indent=2), encoding="utf-8")
+            SETTINGS_PATH.write_bytes(payload)
+        # Prime the cache with what was just written so the load that usually
+        # follows a save does not re-read and re-parse the file.
+        stamp = _settings_stamp()
+        if stamp is not None:
+            _settings_cache = (stamp, {**SETTINGS_DEFAULTS, **settings})
     finally:
         _release_settings_lock(fd)
 
 
+_ENV_KEYS: frozenset[str] = frozenset({
+    "OPENAI_COMPAT_API_KEY", "OPENAI_COMPAT_BASE_URL",
+    "OPENROUTER_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY",
+    "OUROBOROS_MODEL", "OUROBOROS_MODEL_CODE", "OUROBOROS_MODEL_LIGHT",
+    "OUROBOROS_MODEL_FALLBACK", "CLAUDE_CODE_MODEL",
+    "TOTAL_BUDGET", "GITHUB_TOKEN", "GITHUB_REPO",
+    "OUROBOROS_BG_MAX_ROUNDS", "OUROBOROS_BG_WAKEUP_MIN", "OUROBOROS_BG_WAKEUP_MAX",
+    "OUROBOROS_EVO_COST_THRESHOLD", "OUROBOROS_WEBSEARCH_MODEL",
+    "LOCAL_MODEL_SOURCE", "LOCAL_MODEL_FILENAME",
+    "LOCAL_MODEL_PORT", "LOCAL_MODEL_N_GPU_LAYERS", "LOCAL_MODEL_CONTEXT_LENGTH",
+    "LOCAL_MODEL_CHAT_FORMAT",
+    "USE_LOCAL_MAIN", "USE_LOCAL_CODE", "USE_LOCAL_LIGHT", "USE_LOCAL_FALLBACK",
+})
+
+
 def apply_settings_to_env(settings: SettingsDict) -> None:
-    """Push settings into environment variables for supervisor modules."""
-    env_keys = [
-        "OPENAI_COMPAT_API_KEY", "OPENAI_COMPAT_BASE_URL",
-        "OPENROUTER_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY",
-        "OUROBOROS_MODEL", "OUROBOROS_MODEL_CODE", "OUROBOROS_MODEL_LIGHT",
-        "OUROBOROS_MODEL_FALLBACK", "CLAUDE_CODE_MODEL",
-        "TOTAL_BUDGET", "GITHUB_TOKEN", "GITHUB_REPO",
-        "OUROBOROS_BG_MAX_ROUNDS", "OUROBOROS_BG_WAKEUP_MIN", "OUROBOROS_BG_WAKEUP_MAX",
-        "OUROBOROS_EVO_COST_THRESHOLD", "OUROBOROS_WEBSEARCH_MODEL",
-        "LOCAL_MODEL_SOURCE", "LOCAL_MODEL_FILENAME",
-        "LOCAL_MODEL_PORT", "LOCAL_MODEL_N_GPU_LAYERS", "LOCAL_MODEL_CONTEXT_LENGTH",
-        "LOCAL_MODEL_CHAT_FORMAT",
-        "USE_LOCAL_MAIN", "USE_LOCAL_CODE", "USE_LOCAL_LIGHT", "USE_LOCAL_FALLBACK",
-    ]
-    for k in env_keys:
+    """Push settings into environment variables for supervisor modules.
+
+    Only keys whose value actually changed are written: each os.environ write
+    is a SetEnvironmentVariableW/putenv call, not a dict store.
+    """
+    environ = os.environ
+    for k in _ENV_KEYS:
         val = settings.get(k)
         if val is None or val == "":
-            os.environ.pop(k, None)
-        else:
-            os.environ[k] = str(val)
+            if k in environ:
+                del environ[k]
+            continue
+        sval = val if isinstance(val, str) else str(val)
+        if environ.get(k) != sval:
+            environ[k] = sval
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,63 @@
+"""
+Ouroboros — Login-shell PATH for GUI launches on macOS.
+
+Apps started from Finder get a minimal PATH; the launcher asks a login bash for
+the user's real one. That costs a shell startup (profile scripts, brew
+shellenv), so the answer is cached and reused until a profile file changes.
+Does not import anything from ouroboros.* (zero dependency level).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import subprocess
+import time
+from typing import Optional
+
+# Files whose edits can change what `bash -l` puts on PATH.
+_PROFILE_FILES = (
+    "~/.bash_profile", "~/.bash_login", "~/.profile", "~/.zprofile",
+    "/etc/profile", "/etc/paths", "/etc/paths.d",
+)
+_CACHE_TTL_SEC = 24 * 3600
+
+
+def _profile_stamp() -> list[list]:
+    stamp = []
+    for p in _PROFILE_FILES:
+        path = os.path.expanduser(p)
+        try:
+            stamp.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            continue
+    return stamp
+
+
+def login_shell_path(cache_file: pathlib.Path) -> Optional[str]:
+    """PATH as seen by a login bash, served from *cache_file* while still fresh."""
+    stamp = _profile_stamp()
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached.get("stamp") == stamp and time.time() - cached.get("ts", 0) < _CACHE_TTL_SEC:
+            return cached.get("path") or None
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        shell_path = subprocess.check_output(
+            ["/bin/bash", "-l", "-c", "echo $PATH"], text=True, timeout=5,
+        ).strip()
+    except Exception:
+        return None
+    if shell_path:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps({"stamp": stamp, "ts": time.time(), "path": shell_path}),
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+    return shell_path or None
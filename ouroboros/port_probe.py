@@ -0,0 +1,171 @@
+"""
+Ouroboros — Find processes listening on a local TCP port.
+
+Used by the launcher to clear stale agent servers before (re)starting one.
+Does not import anything from ouroboros.* (zero dependency level).
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import Optional
+
+
+def _pids_via_proc(port: int) -> Optional[set[int]]:
+    """Linux: resolve listeners from /proc/net/tcp{,6} + /proc/*/fd (what `ss -p` does, minus the fork).
+
+    Returns None when /proc isn't usable so the caller can fall back.
+    """
+    inodes: set[str] = set()
+    try:
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                with open(table, encoding="ascii") as f:
+                    next(f, None)  # header
+                    for line in f:
+                        fields = line.split()
+                        # local_address is HEXIP:HEXPORT; state 0A == LISTEN
+                        if len(fields) > 9 and fields[3] == "0A" \
+                                and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                            inodes.add(fields[9])
+            except FileNotFoundError:
+                continue
+    except (OSError, ValueError):
+        return None
+    if not inodes:
+        return set()
+
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    pids: set[int] = set()
+    for pid_dir in os.listdir("/proc"):
+        if not pid_dir.isdigit():
+            continue
+        fd_dir = f"/proc/{pid_dir}/fd"
+        try:
+            for fd in os.listdir(fd_dir):
+                if os.readlink(f"{fd_dir}/{fd}") in targets:
+                    pids.add(int(pid_dir))
+                    break
+        except OSError:
+            continue  # process exited or not ours to inspect
+    return pids
+
+
+def _pids_via_psutil(port: int) -> Optional[set[int]]:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        return {c.pid for c in psutil.net_connections(kind="tcp")
+                if c.pid and c.laddr and c.laddr.port == port and c.status == psutil.CONN_LISTEN}
+    except Exception:
+        return None
+
+
+# port -> (monotonic ts, pids); dedupes back-to-back probes during restart storms
+_port_pids_cache: dict[int, tuple[float, set[int]]] = {}
+_PORT_PIDS_TTL_SEC = 1.0
+
+
+def pids_listening_on_port(port: int) -> set[int]:
+    """PIDs of processes with a TCP socket listening on `port` (cached ~1s)."""
+    cached = _port_pids_cache.get(port)
+    if cached is not None and time.monotonic() - cached[0] < _PORT_PIDS_TTL_SEC:
+        return set(cached[1])
+    pids = _probe_listening_pids(port)
+    _port_pids_cache[port] = (time.monotonic(), set(pids))
+    return pids
+
+
+def _parse_netstat(out: str, port: int) -> set[int]:
+    """PIDs from `netstat -ano` rows whose local address ends in :port.
+
+    PID 0 (TIME_WAIT and other kernel-owned rows) is dropped: it is not a
+    process the launcher could or should kill.
+    """
+    # Trailing space so ":8765" does not also match ":87650".
+    port_tok = f":{port} "
+    pids: set[int] = set()
+    for line in out.splitlines():
+        if port_tok not in line:
+            continue
+        line = line.strip()
+        # Only the local-address column (second field) counts.
+        local = line.partition(" ")[2].lstrip().partition(" ")[0]
+        if not local.endswith(port_tok[:-1]):
+            continue
+        pid = line.rpartition(" ")[2]
+        if pid.isdigit() and int(pid) > 0:
+            pids.add(int(pid))
+    return pids
+
+
+def _parse_ss(out: str, port: int) -> set[int]:
+    """PIDs from `ss -ltnp` rows whose local address ends in :port."""
+    port_tok = f":{port} "
+    pids: set[int] = set()
+    for line in out.splitlines():
+        if port_tok not in line:
+            continue
+        # State Recv-Q Send-Q Local Peer [Process]; only Local counts.
+        fields = line.split()
+        if len(fields) < 5 or not fields[3].endswith(port_tok[:-1]):
+            continue
+        start = line.find("pid=")
+        if start < 0:
+            continue
+        start += 4
+        end = start
+        while end < len(line) and line[end].isdigit():
+            end += 1
+        if end > start and int(line[start:end]) > 0:
+            pids.add(int(line[start:end]))
+    return pids
+
+
+def _probe_listening_pids(port: int) -> set[int]:
+    # In-process first: /proc on Linux, then psutil (if installed) anywhere.
+    # psutil needs root for this on macOS and returns None there.
+    found = _pids_via_proc(port) if sys.platform.startswith("linux") else None
+    if found is None:
+        found = _pids_via_psutil(port)
+    if found is not None:
+        return found
+
+    pids: set[int] = set()
+    commands: list[list[str]] = []
+    if sys.platform == "win32":
+        commands = [["netstat", "-ano", "-p", "tcp"]]
+    else:
+        commands = [
+            ["lsof", "-ti", f"tcp:{port}"],
+            ["ss", "-ltnp"],
+        ]
+
+    for cmd in commands:
+        if shutil.which(cmd[0]) is None:
+            continue
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        except Exception:
+            continue
+
+        out = result.stdout
+        if cmd[0] == "netstat":
+            pids |= _parse_netstat(out, port)
+        elif cmd[0] == "lsof":
+            for pid_str in out.split():
+                if pid_str.isdigit() and int(pid_str) > 0:
+                    pids.add(int(pid_str))
+        else:
+            pids |= _parse_ss(out, port)
+
+        if pids:
+            break
+
+    return pids
@@ -7,7 +7,8 @@ import os
 import pathlib
 import subprocess
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from ouroboros.tools.registry import ToolContext, ToolEntry
 from ouroboros.utils import utc_now_iso, write_text, safe_relpath, run_cmd
@@ -18,6 +19,16 @@ _BINARY_EXTENSIONS = frozenset({
 })
 
 
+# No opportunistic index-lock refreshes (status/diff never block a concurrent
+# commit), never wait on a credential prompt, and skip gettext/locale setup.
+_GIT_ENV_OVERRIDES = {"GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0", "LC_ALL": "C"}
+
+
+def _git(repo_dir, *args: str) -> str:
+    """run_cmd(["git", *args]) in *repo_dir* with _GIT_ENV_OVERRIDES applied."""
+    return run_cmd(["git", *args], cwd=repo_dir, env={**os.environ, **_GIT_ENV_OVERRIDES})
+
+
 def _ensure_gitignore(repo_dir) -> None:
     """Safety net: if .gitignore is missing, create a minimal one before git add."""
     gi = pathlib.Path(repo_dir) / ".gitignore"
@@ -30,24 +41,25 @@ def _ensure_gitignore(repo_dir) -> None:
     )
 
 
-def _unstage_binaries(repo_dir) -> List[str]:
+def _staged_paths(repo_dir) -> Optional[List[str]]:
+    """Paths in the index that differ from HEAD, or None if git failed."""
+    try:
+        staged = _git(repo_dir, "diff", "--cached", "--name-only")
+    except Exception:
+        return None
+    return [f for f in (line.strip() for line in staged.splitlines()) if f]
+
+
+def _unstage_binaries(repo_dir, staged: List[str]) -> List[str]:
     """After git add, unstage files with binary extensions that shouldn't be tracked."""
+    removed = [f for f in staged if os.path.splitext(f)[1].lower() in _BINARY_EXTENSIONS]
+    if not removed:
+        return []
+    # One reset for all paths instead of a git spawn per file.
     try:
-        staged = run_cmd(["git", "diff", "--cached", "--name-only"], cwd=repo_dir)
+        _git(repo_dir, "reset", "-q", "HEAD", "--", *removed)
     except Exception:
         return []
-    removed = []
-    for f in staged.strip().splitlines():
-        f = f.strip()
-        if not f:
-            continue
-        ext = pathlib.Path(f).suffix.lower()
-        if ext in _BINARY_EXTENSIONS:
-            try:
-                run_cmd(["git", "reset", "HEAD", "--", f], cwd=repo_dir)
-                removed.append(f)
-            except Exception:
-                pass
     return removed
 
 log = logging.getLogger(__name__)
@@ -60,8 +72,8 @@ def _acquire_git_lock(ctx: ToolContext, timeout_sec: int = 120) -> pathlib.Path:
     lock_dir.mkdir(parents=True, exist_ok=True)
     lock_path = lock_dir / "git.lock"
     stale_sec = 600
-    deadline = time.time() + timeout_sec
-    while time.time() < deadline:
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
         if lock_path.exists():
             try:
                 age = time.time() - lock_path.stat().st_mtime
@@ -89,15 +101,39 @@ def _release_git_lock(lock_path: pathlib.Path) -> None:
         pass
 
 
+def _current_branch(repo_dir) -> str:
+    """Checked-out branch name read in-process via dulwich ("" if unknown)."""
+    try:
+        import dulwich.repo
+        repo = dulwich.repo.Repo(str(repo_dir))
+        try:
+            head = repo.refs.read_ref(b"HEAD") or b""
+        finally:
+            repo.close()
+    except Exception:
+        log.debug("dulwich HEAD read failed for %s", repo_dir, exc_info=True)
+        return ""
+    prefix = b"ref: refs/heads/"
+    return head[len(prefix):].strip().decode("utf-8") if head.startswith(prefix) else ""
+
+
+def _checkout_dev(ctx: ToolContext) -> None:
+    """git checkout ctx.branch_dev, skipping the spawn when it is already checked out."""
+    if _current_branch(ctx.repo_dir) != ctx.branch_dev:
+        _git(ctx.repo_dir, "checkout", ctx.branch_dev)
+
+
 # --- Pre-push test gate ---
 
 MAX_TEST_OUTPUT = 8000
 _consecutive_test_failures: int = 0
 
 def _log_test_failure(ctx: ToolContext, commit_message: str, test_output: str) -> None:
-    from ouroboros.utils import append_jsonl, utc_now_iso
+    from ouroboros.utils import append_jsonl_async
     try:
-        append_jsonl(ctx.drive_path("logs") / "events.jsonl", {
+        # Telemetry only: queued for the shared background JSONL writer so the
+        # blocked-commit reply is not held up by the log write.
+        append_jsonl_async(ctx.drive_path("logs") / "events.jsonl", {
             "ts": utc_now_iso(),
             "type": "commit_test_failure",
             "commit_message": commit_message[:200],
@@ -149,8 +185,35 @@ def _run_pre_push_tests(ctx: ToolContext) -> Optional[str]:
         return f"⚠️ PRE_PUSH_TEST_ERROR: Unexpected error running tests: {e}"
 
 
-def _git_commit_with_tests(ctx: ToolContext) -> Optional[str]:
-    """Run pre-commit tests. Returns None on success, error string on failure."""
+# Non-Python files the test suite reads; changing one still needs a test run.
+_TEST_INPUT_FILES = frozenset({"VERSION", "README.md", "BIBLE.md"})
+
+
+def _paths_affect_tests(paths: List[str]) -> bool:
+    return any(
+        f.endswith(".py") or f.startswith("tests/") or f in _TEST_INPUT_FILES
+        for f in paths
+    )
+
+
+def _commit_affects_tests(repo_dir) -> bool:
+    """True unless HEAD provably touches nothing the test suite depends on."""
+    try:
+        changed = _git(repo_dir, "diff-tree", "--root", "--no-commit-id", "--name-only", "-r", "HEAD")
+    except Exception:
+        return True
+    return _paths_affect_tests([line.strip() for line in changed.splitlines()])
+
+
+def _git_commit_with_tests(ctx: ToolContext, changed: Optional[List[str]] = None) -> Optional[str]:
+    """Run pre-commit tests. Returns None on success, error string on failure.
+
+    *changed* lists the paths being committed; without it HEAD's diff is used.
+    """
+    if ctx is not None and not (
+        _paths_affect_tests(changed) if changed is not None else _commit_affects_tests(ctx.repo_dir)
+    ):
+        return None  # docs/prompts-only commit: skip the pytest spawn
     test_error = _run_pre_push_tests(ctx)  # repurpose existing test runner
     if test_error:
         log.error("Tests failed, blocking commit")
@@ -159,6 +222,21 @@ def _git_commit_with_tests(ctx: ToolContext) -> Optional[str]:
     return None
 
 
+# Tests run against the working tree, which already holds what is about to be
+# committed, so pytest overlaps `git commit` instead of following it.
+_TEST_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pre-commit-tests")
+
+
+def _abandon_tests(tests: Optional[Future]) -> None:
+    """Drop a test run whose commit failed without letting it outlive the git lock."""
+    if tests is None or tests.cancel():
+        return
+    try:
+        tests.result()
+    except Exception:
+        log.debug("Abandoned pre-commit test run raised", exc_info=True)
+
+
 # --- Tool implementations ---
 
 def _repo_write_commit(ctx: ToolContext, path: str, content: str, commit_message: str, skip_tests: bool = False) -> str:
@@ -169,7 +247,7 @@ def _repo_write_commit(ctx: ToolContext, path: str, content: str, commit_message
     lock = _acquire_git_lock(ctx)
     try:
         try:
-            run_cmd(["git", "checkout", ctx.branch_dev], cwd=ctx.repo_dir)
+            _checkout_dev(ctx)
         except Exception as e:
             return f"⚠️ GIT_ERROR (checkout): {e}"
         try:
@@ -177,16 +255,21 @@ def _repo_write_commit(ctx: ToolContext, path: str, content: str, commit_message
         except Exception as e:
             return f"⚠️ FILE_WRITE_ERROR: {e}"
         try:
-            run_cmd(["git", "add", safe_relpath(path)], cwd=ctx.repo_dir)
+            _git(ctx.repo_dir, "add", safe_relpath(path))
         except Exception as e:
             return f"⚠️ GIT_ERROR (add): {e}"
+        # git commit takes the whole index, so gate on everything staged, not
+        # just the file written here.
+        staged = _staged_paths(ctx.repo_dir)
+        tests = None if skip_tests else _TEST_POOL.submit(_git_commit_with_tests, ctx, staged)
         try:
-            run_cmd(["git", "commit", "-m", commit_message], cwd=ctx.repo_dir)
+            _git(ctx.repo_dir, "commit", "-m", commit_message)
         except Exception as e:
+            _abandon_tests(tests)
             return f"⚠️ GIT_ERROR (commit): {e}"
 
-        if not skip_tests:
-            push_error = _git_commit_with_tests(ctx)
+        if tests is not None:
+            push_error = tests.result()
             if push_error:
                 _consecutive_test_failures += 1
                 _log_test_failure(ctx, commit_message, push_error)
@@ -195,7 +278,7 @@ def _repo_write_commit(ctx: ToolContext, path: str, content: str, commit_message
                     ctx.last_push_succeeded = True
                     return f"OK: committed to {ctx.branch_dev}: {commit_message}\n\n[TESTS_SKIPPED: 3 consecutive failures. Tests are likely broken, please fix them.]"
                 # Revert the commit if tests failed to avoid committing bad code
-                run_cmd(["git", "reset", "--soft", "HEAD~1"], cwd=ctx.repo_dir)
+                _git(ctx.repo_dir, "reset", "--soft", "HEAD~1")
                 return push_error
         
         _consecutive_test_failures = 0
@@ -213,7 +296,7 @@ def _repo_commit_push(ctx: ToolContext, commit_message: str, paths: Optional[Lis
     lock = _acquire_git_lock(ctx)
     try:
         try:
-            run_cmd(["git", "checkout", ctx.branch_dev], cwd=ctx.repo_dir)
+            _checkout_dev(ctx)
         except Exception as e:
             return f"⚠️ GIT_ERROR (checkout): {e}"
         if paths:
@@ -221,31 +304,32 @@ def _repo_commit_push(ctx: ToolContext, commit_message: str, paths: Optional[Lis
                 safe_paths = [safe_relpath(p) for p in paths if str(p).strip()]
             except ValueError as e:
                 return f"⚠️ PATH_ERROR: {e}"
-            add_cmd = ["git", "add"] + safe_paths
+            add_args = ["add"] + safe_paths
         else:
             _ensure_gitignore(ctx.repo_dir)
-            add_cmd = ["git", "add", "-A"]
+            add_args = ["add", "-A"]
         try:
-            run_cmd(add_cmd, cwd=ctx.repo_dir)
+            _git(ctx.repo_dir, *add_args)
         except Exception as e:
             return f"⚠️ GIT_ERROR (add): {e}"
-        if not paths:
-            removed = _unstage_binaries(ctx.repo_dir)
+        # One index listing serves both the binary filter and the empty-commit check.
+        staged = _staged_paths(ctx.repo_dir)
+        if not paths and staged:
+            removed = _unstage_binaries(ctx.repo_dir, staged)
             if removed:
                 log.warning("Unstaged %d binary files: %s", len(removed), removed)
-        try:
-            status = run_cmd(["git", "status", "--porcelain"], cwd=ctx.repo_dir)
-        except Exception as e:
-            return f"⚠️ GIT_ERROR (status): {e}"
-        if not status.strip():
+                staged = [f for f in staged if f not in removed]
+        if staged is not None and not staged:
             return "⚠️ GIT_NO_CHANGES: nothing to commit."
+        tests = None if skip_tests else _TEST_POOL.submit(_git_commit_with_tests, ctx, staged)
         try:
-            run_cmd(["git", "commit", "-m", commit_message], cwd=ctx.repo_dir)
+            _git(ctx.repo_dir, "commit", "-m", commit_message)
         except Exception as e:
+            _abandon_tests(tests)
             return f"⚠️ GIT_ERROR (commit): {e}"
 
-        if not skip_tests:
-            push_error = _git_commit_with_tests(ctx)
+        if tests is not None:
+            push_error = tests.result()
             if push_error:
                 _consecutive_test_failures += 1
                 _log_test_failure(ctx, commit_message, push_error)
@@ -255,7 +339,7 @@ def _repo_commit_push(ctx: ToolContext, commit_message: str, paths: Optional[Lis
                     result = f"OK: committed to {ctx.branch_dev}: {commit_message}\n\n[TESTS_SKIPPED: 3 consecutive failures. Tests are likely broken, please fix them.]"
                     if paths is not None:
                         try:
-                            untracked = run_cmd(["git", "ls-files", "--others", "--exclude-standard"], cwd=ctx.repo_dir)
+                            untracked = _git(ctx.repo_dir, "ls-files", "--others", "--exclude-standard")
                             if untracked.strip():
                                 files = ", ".join(untracked.strip().split("\n"))
                                 result += f"\n⚠️ WARNING: untracked files remain: {files} — they are NOT in git. Use repo_commit without paths to add everything."
@@ -264,7 +348,7 @@ def _repo_commit_push(ctx: ToolContext, commit_message: str, paths: Optional[Lis
                             pass
                     return result
                 # Revert the commit if tests failed to avoid committing bad code
-                run_cmd(["git", "reset", "--soft", "HEAD~1"], cwd=ctx.repo_dir)
+                _git(ctx.repo_dir, "reset", "--soft", "HEAD~1")
                 return push_error
         
         _consecutive_test_failures = 0
@@ -274,7 +358,7 @@ def _repo_commit_push(ctx: ToolContext, commit_message: str, paths: Optional[Lis
     result = f"OK: committed to {ctx.branch_dev}: {commit_message}"
     if paths is not None:
         try:
-            untracked = run_cmd(["git", "ls-files", "--others", "--exclude-standard"], cwd=ctx.repo_dir)
+            untracked = _git(ctx.repo_dir, "ls-files", "--others", "--exclude-standard")
             if untracked.strip():
                 files = ", ".join(untracked.strip().split("\n"))
                 result += f"\n⚠️ WARNING: untracked files remain: {files} — they are NOT in git. Use repo_commit without paths to add everything."
@@ -286,17 +370,59 @@ def _repo_commit_push(ctx: ToolContext, commit_message: str, paths: Optional[Lis
 
 def _git_status(ctx: ToolContext) -> str:
     try:
-        return run_cmd(["git", "status", "--porcelain"], cwd=ctx.repo_dir)
+        return _git(ctx.repo_dir, "status", "--porcelain")
     except Exception as e:
         return f"⚠️ GIT_ERROR: {e}"
 
 
+# repo_dir -> (key, output). A staged diff depends only on the index and what
+# HEAD points at, so it is reused until one of those files changes. Working-tree
+# status/diff are not cached: plain file edits never touch .git.
+_staged_diff_cache: Dict[str, Tuple[tuple, str]] = {}
+
+
+def _staged_diff_key(repo_dir) -> Optional[tuple]:
+    git_dir = pathlib.Path(repo_dir) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_bytes()
+    except OSError:
+        return None  # worktree/gitfile layouts: just run git
+    key: list = [head]
+    # mtime alone is too coarse on HFS+/FAT (1-2 s), so content identifies the
+    # index (its trailing checksum: 20 bytes SHA-1, 32 SHA-256) and the branch ref.
+    index = git_dir / "index"
+    try:
+        with index.open("rb") as f:
+            st = os.fstat(f.fileno())
+            f.seek(max(0, st.st_size - 32))
+            key.append(("index", st.st_mtime_ns, st.st_size, f.read()))
+    except OSError:
+        key.append(("index", None))
+    if head.startswith(b"ref: "):
+        try:
+            key.append((git_dir / head[5:].strip().decode("utf-8", "replace")).read_bytes())
+        except OSError:
+            key.append(None)  # packed ref: covered by the packed-refs stamp
+    try:
+        st = (git_dir / "packed-refs").stat()
+        key.append(("packed-refs", st.st_mtime_ns, st.st_size))
+    except OSError:
+        key.append(("packed-refs", None))
+    return tuple(key)
+
+
 def _git_diff(ctx: ToolContext, staged: bool = False) -> str:
     try:
-        cmd = ["git", "diff"]
-        if staged:
-            cmd.append("--staged")
-        return run_cmd(cmd, cwd=ctx.repo_dir)
+        if not staged:
+            return _git(ctx.repo_dir, "diff")
+        key = _staged_diff_key(ctx.repo_dir)
+        cached = _staged_diff_cache.get(str(ctx.repo_dir))
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+        out = _git(ctx.repo_dir, "diff", "--staged")
+        if key is not None:
+            _staged_diff_cache[str(ctx.repo_dir)] = (key, out)
+        return out
     except Exception as e:
         return f"⚠️ GIT_ERROR: {e}"
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from ouroboros.tools.registry import ToolContext, ToolEntry
 from ouroboros.utils import utc_now_iso
@@ -38,6 +39,24 @@ def _estimate_openai_cost(model: str, input_tokens: int, output_tokens: int) ->
     return round(input_tokens * input_price / 1_000_000 + output_tokens * output_price / 1_000_000, 6)
 
 
+# One client (and its keep-alive connection pool) per key/base_url, so repeat
+# searches skip the TCP+TLS handshake.
+_client_cache: Dict[Tuple[str, str], Any] = {}
+
+
+def _get_client(api_key: str, base_url: str) -> Any:
+    cache_key = (hashlib.sha1(api_key.encode("utf-8")).hexdigest(), base_url)
+    client = _client_cache.get(cache_key)
+    if client is None:
+        from openai import OpenAI
+        if base_url:
+            client = OpenAI(api_key=api_key, base_url=base_url)
+        else:
+            client = OpenAI(api_key=api_key)
+        _client_cache[cache_key] = client
+    return client
+
+
 def _web_search(
     ctx: ToolContext,
     query: str,
@@ -57,12 +76,8 @@ def _web_search(
     active_effort = reasoning_effort or DEFAULT_REASONING_EFFORT
 
     try:
-        from openai import OpenAI
         compat_base = os.environ.get("OPENAI_COMPAT_BASE_URL", "").strip()
-        if compat_key and compat_base:
-            client = OpenAI(api_key=api_key, base_url=compat_base)
-        else:
-            client = OpenAI(api_key=api_key)
+        client = _get_client(api_key, compat_base if compat_key else "")
         resp = client.responses.create(
             model=active_model,
             tools=[{
@@ -150,6 +150,20 @@ _NODE_DIR = pathlib.Path.home() / "Ouroboros" / "node"
 _NODE_BIN = _NODE_DIR / "bin"
 _install_lock = threading.Lock()
 _path_initialized = False
+_claude_bin: Optional[str] = None
+
+
+def _which_claude() -> Optional[str]:
+    """Resolve the claude binary, reusing the last hit while it still exists.
+
+    shutil.which stats every PATH entry (times PATHEXT on Windows); after the
+    first hit a single stat on the cached path is enough.
+    """
+    global _claude_bin
+    if _claude_bin and os.path.isfile(_claude_bin):
+        return _claude_bin
+    _claude_bin = shutil.which("claude")
+    return _claude_bin
 
 
 def _ensure_claude_cli(ctx: ToolContext) -> Optional[str]:
@@ -158,7 +172,7 @@ def _ensure_claude_cli(ctx: ToolContext) -> Optional[str]:
     Returns error string or None on success.
     """
     _ensure_path()
-    if shutil.which("claude"):
+    if _which_claude():
         return None
 
     if platform.system() != "Darwin":
@@ -166,7 +180,7 @@ def _ensure_claude_cli(ctx: ToolContext) -> Optional[str]:
 
     with _install_lock:
         _ensure_path()
-        if shutil.which("claude"):
+        if _which_claude():
             return None
 
         ctx.emit_progress_fn("Claude CLI not found. Installing Node.js + Claude Code...")
@@ -192,7 +206,7 @@ def _ensure_claude_cli(ctx: ToolContext) -> Optional[str]:
             return f"⚠️ npm install failed: {e}"
 
         _ensure_path()
-        if shutil.which("claude"):
+        if _which_claude():
             ctx.emit_progress_fn("Claude Code CLI installed successfully.")
             return None
         return "⚠️ Claude Code CLI binary not found in PATH after auto-install."
@@ -243,7 +257,7 @@ def _build_augmented_path() -> str:
         if d not in current and (d == str(_NODE_BIN) or pathlib.Path(d).exists()):
             parts.append(d)
     if parts:
-        return ":".join(parts) + ":" + current
+        return os.pathsep.join(parts) + os.pathsep + current
     return current
 
 
@@ -262,7 +276,7 @@ def _ensure_path():
 def _run_claude_cli(work_dir: str, prompt: str, env: dict,
                     model: str = "", budget: Optional[float] = None) -> CompletedProcess:
     """Run Claude CLI with permission-mode fallback."""
-    claude_bin = shutil.which("claude")
+    claude_bin = _which_claude()
     cmd = [
         claude_bin, "-p", prompt,
         "--output-format", "json",
@@ -13,9 +13,11 @@ import json
 import logging
 import os
 import pathlib
+import queue
 import subprocess
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
@@ -34,8 +36,12 @@ def set_log_sink(fn: Optional[Callable[[Dict[str, Any]], None]]) -> None:
 # Time
 # ---------------------------------------------------------------------------
 
+_UTC = _dt.timezone.utc
+_now = _dt.datetime.now
+
+
 def utc_now_iso() -> str:
-    return _dt.datetime.now(tz=_dt.timezone.utc).isoformat()
+    return _now(tz=_UTC).isoformat()
 
 
 # ---------------------------------------------------------------------------
@@ -59,11 +65,41 @@ def write_text(path: pathlib.Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+# Directories already created by this process. Logs, state and locks are written
+# constantly; skipping the repeated mkdir(exist_ok=True) matters on synced drives.
+_ensured_dirs: set = set()
+
+
+def ensure_dir(path: pathlib.Path) -> None:
+    """mkdir -p, skipped when this process has already ensured `path`."""
+    key = str(path)
+    if key in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(key)
+
+
+def reensure_dir(path: pathlib.Path) -> None:
+    """mkdir -p `path` even if cached (it may have been deleted behind our back)."""
+    _ensured_dirs.discard(str(path))
+    ensure_dir(path)
+
+
+def forget_ensured_dirs() -> None:
+    """Drop the ensure_dir cache (call after deleting data directories)."""
+    _ensured_dirs.clear()
+
+
 def append_jsonl(path: pathlib.Path, obj: Dict[str, Any]) -> None:
     """Append a JSON object as a line to a JSONL file (concurrent-safe)."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(obj, ensure_ascii=False)
-    data = (line + "\n").encode("utf-8")
+    _append_jsonl_records(path, [obj])
+
+
+def _append_jsonl_records(path: pathlib.Path, objs: List[Dict[str, Any]]) -> None:
+    """Append several JSON objects under one lock acquisition and one write."""
+    ensure_dir(path.parent)
+    text = "".join(json.dumps(obj, ensure_ascii=False) + "\n" for obj in objs)
+    data = text.encode("utf-8")
 
     lock_timeout_sec = 2.0
     lock_stale_sec = 10.0
@@ -111,10 +147,12 @@ def append_jsonl(path: pathlib.Path, obj: Dict[str, Any]) -> None:
                 if attempt < write_retries - 1:
                     time.sleep(retry_sleep_base_sec * (2 ** attempt))
 
+        # The directory may have been removed behind our back; re-create it.
+        reensure_dir(path.parent)
         for attempt in range(write_retries):
             try:
                 with path.open("a", encoding="utf-8") as f:
-                    f.write(line + "\n")
+                    f.write(text)
                 _written = True
                 return
             except Exception:
@@ -136,10 +174,79 @@ def append_jsonl(path: pathlib.Path, obj: Dict[str, Any]) -> None:
                 log.debug("Failed to unlink lock file after jsonl append", exc_info=True)
                 pass
         if _written and _log_sink is not None:
+            for obj in objs:
+                try:
+                    _log_sink(obj)
+                except Exception:
+                    pass
+
+
+# Telemetry records queued here are written by a background thread in batches,
+# keeping file I/O (slow on synced/network drives) off the supervisor loop.
+# When the queue is full new records are dropped rather than blocking, so only
+# diagnostics belong here; audit rows (llm_usage etc.) use append_jsonl.
+_JSONL_Q: "queue.Queue[Tuple[pathlib.Path, Dict[str, Any]]]" = queue.Queue(maxsize=1024)
+_JSONL_BATCH_MAX = 64
+_jsonl_writer: Optional[threading.Thread] = None
+_jsonl_writer_lock = threading.Lock()
+
+
+def _reset_jsonl_writer_after_fork() -> None:
+    # A forked child inherits the parent's pending records and possibly a held
+    # queue mutex, but not its writer thread. Start clean so the child neither
+    # re-writes the parent's records nor deadlocks on put_nowait.
+    global _JSONL_Q, _jsonl_writer, _jsonl_writer_lock
+    _JSONL_Q = queue.Queue(maxsize=1024)
+    _jsonl_writer = None
+    _jsonl_writer_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_jsonl_writer_after_fork)
+
+
+def append_jsonl_async(path: pathlib.Path, obj: Dict[str, Any]) -> None:
+    """Queue a telemetry record for append_jsonl on the background writer thread."""
+    global _jsonl_writer
+    if _jsonl_writer is None or not _jsonl_writer.is_alive():
+        with _jsonl_writer_lock:
+            if _jsonl_writer is None or not _jsonl_writer.is_alive():
+                _jsonl_writer = threading.Thread(
+                    target=_jsonl_writer_loop, name="jsonl-writer", daemon=True,
+                )
+                _jsonl_writer.start()
+    try:
+        _JSONL_Q.put_nowait((path, obj))
+    except queue.Full:
+        log.debug("append_jsonl_async: queue full, dropping record for %s", path)
+
+
+def flush_jsonl_async(timeout: float = 2.0) -> None:
+    """Wait (bounded) until the background writer has drained queued records."""
+    deadline = time.time() + timeout
+    while _JSONL_Q.unfinished_tasks and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def _jsonl_writer_loop() -> None:
+    while True:
+        records = [_JSONL_Q.get()]
+        while len(records) < _JSONL_BATCH_MAX:
             try:
-                _log_sink(obj)
-            except Exception:
-                pass
+                records.append(_JSONL_Q.get_nowait())
+            except queue.Empty:
+                break
+        by_path: Dict[pathlib.Path, List[Dict[str, Any]]] = {}
+        for path, obj in records:
+            by_path.setdefault(path, []).append(obj)
+        try:
+            for path, objs in by_path.items():
+                _append_jsonl_records(path, objs)
+        except Exception:
+            log.warning("jsonl writer: batch write failed", exc_info=True)
+        finally:
+            for _ in records:
+                _JSONL_Q.task_done()
 
 
 # ---------------------------------------------------------------------------
@@ -184,8 +291,9 @@ def estimate_tokens(text: str) -> int:
 # Subprocess
 # ---------------------------------------------------------------------------
 
-def run_cmd(cmd: List[str], cwd: Optional[pathlib.Path] = None) -> str:
-    res = subprocess.run(cmd, cwd=str(cwd) if cwd else None, capture_output=True, text=True)
+def run_cmd(cmd: List[str], cwd: Optional[pathlib.Path] = None,
+            env: Optional[Dict[str, str]] = None) -> str:
+    res = subprocess.run(cmd, cwd=str(cwd) if cwd else None, env=env, capture_output=True, text=True)
     if res.returncode != 0:
         raise RuntimeError(
             f"Command failed: {' '.join(cmd)}\n\nSTDOUT:\n{res.stdout}\n\nSTDERR:\n{res.stderr}"
@@ -1,60 +1,25 @@
+import atexit
+import functools
+import hashlib
 import os
 import platform
 import subprocess
-import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def generate_world_profile(output_path: str):
-    """Generates a WORLD.md file containing the system profile and hardware details."""
-    
-    # Get basic OS info
-    os_name = platform.system()
-    os_release = platform.release()
-    arch = platform.machine()
-    
-    # Get memory
-    mem_total = "Unknown"
-    try:
-        if os_name == "Darwin":
-            mem_bytes = int(subprocess.check_output(["sysctl", "-n", "hw.memsize"]).strip())
-            mem_total = f"{mem_bytes / (1024**3):.1f} GB"
-        elif os_name == "Linux":
-            mem_total = subprocess.check_output(["awk", "/MemTotal/ {print $2/1024/1024 \" GB\"}", "/proc/meminfo"]).strip().decode()
-    except Exception:
-        pass
-        
-    # Get CPU
-    cpu_info = platform.processor()
-    try:
-        if os_name == "Darwin":
-            cpu_info = subprocess.check_output(["sysctl", "-n", "machdep.cpu.brand_string"]).strip().decode()
-    except Exception:
-        pass
-        
-    # User and paths
-    user = os.environ.get("USER", "unknown")
-    cwd = os.getcwd()
-    
-    # Check for CLI tools
-    tools = []
-    for tool in ["git", "python3", "pip", "npm", "node", "claude"]:
-        if shutil.which(tool):
-            tools.append(tool)
-            
-    content = f"""# WORLD.md — Environment Profile
+# Static parts of WORLD.md; generate_world_profile joins the probed values in.
+_WORLD_HEADER = """# WORLD.md — Environment Profile
 
 This is where I currently exist. It defines my hardware, OS, and local constraints.
 
 ## System
-- **OS**: {os_name} {os_release} ({arch})
-- **CPU**: {cpu_info}
-- **RAM**: {mem_total}
-- **User**: {user}
-- **Current Directory**: {cwd}
-
+"""
+_WORLD_TOOLS_INTRO = """
 ## Available Tools
 The following binaries are available in my PATH:
-`{', '.join(tools)}`
-
+"""
+_WORLD_FOOTER = """
 ## File System Rules
 I live inside `~/Ouroboros/`. 
 - `repo/` contains my codebase.
@@ -63,9 +28,231 @@ I should generally confine my writes to these directories, though I have read ac
 
 *(Generated automatically on first boot)*
 """
+
+_PROFILE_TOOLS = ("git", "python3", "pip", "npm", "node", "claude")
+
+
+def _find_on_path(names) -> set:
+    """Which of *names* are executables on PATH, in one directory listing per PATH entry."""
+    if os.name == "nt":
+        exts = [e.lower() for e in os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").split(os.pathsep) if e]
+        wanted = {name + ext: name for name in names for ext in exts}
+    else:
+        wanted = {name: name for name in names}
+    found = set()
+    for d in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not d:
+            continue
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    name = wanted.get(entry.name.lower() if os.name == "nt" else entry.name)
+                    if name and name not in found and entry.is_file() and os.access(entry.path, os.X_OK):
+                        found.add(name)
+        except OSError:
+            continue
+        if len(found) == len(names):
+            break
+    return found
+
+
+# sysctl keys whose value is a native unsigned integer rather than a C string.
+_SYSCTL_INT_KEYS = frozenset({"hw.memsize"})
+
+
+def _sysctlbyname(keys) -> dict:
+    """Read sysctl keys in-process through libc's sysctlbyname ({key: str value})."""
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.dylib")
+        fn = libc.sysctlbyname
+    except (OSError, AttributeError):
+        return {}
+    fn.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
+                   ctypes.c_void_p, ctypes.c_size_t]
+    fn.restype = ctypes.c_int
+    values = {}
+    for key in keys:
+        name = key.encode("ascii")
+        size = ctypes.c_size_t(0)
+        if fn(name, None, ctypes.byref(size), None, 0) != 0 or not size.value:
+            continue
+        buf = ctypes.create_string_buffer(size.value)
+        if fn(name, buf, ctypes.byref(size), None, 0) != 0:
+            continue
+        raw = buf.raw[:size.value]
+        if key in _SYSCTL_INT_KEYS:
+            values[key] = str(int.from_bytes(raw, sys.byteorder))
+        else:
+            values[key] = raw.split(b"\0", 1)[0].decode("utf-8", "replace")
+    return values
+
+
+def _darwin_sysctl(*keys: str) -> dict:
+    """Read several sysctl keys ({key: value}), in-process where possible."""
+    values = _sysctlbyname(keys)
+    missing = [k for k in keys if k not in values]
+    if not missing:
+        return values
+    # Fallback: one `sysctl` spawn for whatever libc could not answer. No -n
+    # and no check: an unknown key is reported on stderr while the rest are
+    # still printed as "key: value", so lines are matched by name.
+    out = subprocess.run(["sysctl", *missing], capture_output=True, text=True).stdout
+    for line in out.splitlines():
+        key, sep, value = line.partition(": ")
+        if sep and key in keys:
+            values[key] = value.strip()
+    return values
+
+
+def _os_triplet() -> tuple:
+    """(system, release, machine) from one uname() where the OS has it."""
+    if hasattr(os, "uname"):
+        u = os.uname()
+        return u.sysname, u.release, u.machine
+    return platform.system(), platform.release(), platform.machine()
+
+
+def _profile_key() -> str:
+    """Digest of everything the profile is derived from; cheap to recompute."""
+    path_dirs = []
+    for d in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        try:
+            path_dirs.append((d, os.stat(d).st_mtime_ns))
+        except OSError:
+            path_dirs.append((d, None))
+    facts = (_os_triplet(), platform.node(), os.environ.get("USER", ""), os.getcwd(), path_dirs)
+    return hashlib.blake2b(repr(facts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+_MEMINFO_FD = None  # opened on first use, kept for later refreshes
+
+
+def _meminfo_first_line() -> str:
+    """First line of /proc/meminfo (MemTotal) via pread on a held-open fd."""
+    global _MEMINFO_FD
+    if _MEMINFO_FD is None:
+        _MEMINFO_FD = os.open("/proc/meminfo", os.O_RDONLY)
+        atexit.register(os.close, _MEMINFO_FD)
+    return os.pread(_MEMINFO_FD, 256, 0).decode("ascii", "replace").partition("\n")[0]
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_brand() -> str:
+    """Linux CPU model name from /proc/cpuinfo ("" if not listed, e.g. some ARM boards)."""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return ""
+
+
+def _probe_hardware(os_name: str) -> tuple:
+    """(RAM, CPU) strings for the profile; "Unknown"/platform defaults on failure."""
+    mem_total = "Unknown"
+    cpu_info = ""
+    try:
+        if os_name == "Darwin":
+            darwin = _darwin_sysctl("hw.memsize", "machdep.cpu.brand_string")
+            if darwin.get("hw.memsize"):
+                mem_total = f"{int(darwin['hw.memsize']) / (1024**3):.1f} GB"
+            cpu_info = darwin.get("machdep.cpu.brand_string", "")
+        elif os_name == "Linux":
+            cpu_info = _cpu_brand()
+            line = _meminfo_first_line()  # "MemTotal:  16303772 kB"
+            if line.startswith("MemTotal:"):
+                kb = int(line.split()[1])
+                mem_total = f"{kb / (1024**2):.1f} GB"
+    except Exception:
+        pass
+    # platform.processor() spawns `uname -p` on Linux; only a last resort.
+    return mem_total, cpu_info or platform.processor()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_content(key: str) -> str:
+    """Probe the machine and render WORLD.md; memoized per _profile_key() value."""
+    # Get basic OS info
+    os_name, os_release, arch = _os_triplet()
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # The PATH walk and the hardware probe are independent I/O; overlap them.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        tools_future = pool.submit(_find_on_path, _PROFILE_TOOLS)
+        mem_total, cpu_info = _probe_hardware(os_name)
+        found = tools_future.result()
+    tools = [tool for tool in _PROFILE_TOOLS if tool in found]
+
+    # User and paths
+    user = os.environ.get("USER", "unknown")
+    cwd = os.getcwd()
+
+    return "".join((
+        _WORLD_HEADER,
+        "- **OS**: ", os_name, " ", os_release, " (", arch, ")\n",
+        "- **CPU**: ", cpu_info, "\n",
+        "- **RAM**: ", mem_total, "\n",
+        "- **User**: ", user, "\n",
+        "- **Current Directory**: ", cwd, "\n",
+        _WORLD_TOOLS_INTRO, "`", ", ".join(tools), "`\n",
+        _WORLD_FOOTER,
+    ))
+
+
+def generate_world_profile(output_path: str, ttl_seconds: float = 60.0, force: bool = False):
+    """Generates a WORLD.md file containing the system profile and hardware details.
+
+    A profile written less than *ttl_seconds* ago is kept as is (one stat);
+    *force* skips that and the input-key check and re-probes.
+    """
+    if force:
+        _build_content.cache_clear()
+    else:
+        try:
+            if time.time() - os.stat(output_path).st_mtime < ttl_seconds:
+                return
+        except OSError:
+            pass
+    # Installing or removing a tool bumps its PATH directory's mtime, so an
+    # unchanged key means the probes would reproduce the same file.
+    key_path = os.path.join(os.path.dirname(output_path) or ".", ".world.key")
+    key = _profile_key()
+    if not force:
+        try:
+            with open(key_path, encoding="ascii") as f:
+                if f.read().strip() == key and os.path.exists(output_path):
+                    return
+        except (OSError, ValueError):
+            pass
+
+
+    content = _build_content(key)
+
+    try:
+        # Text mode (universal newlines) so older CRLF files still compare equal.
+        with open(output_path, encoding="utf-8") as f:
+            unchanged = f.read() == content
+    except (OSError, ValueError):
+        unchanged = False
+    if not unchanged:
+        # One pre-encoded write, no TextIOWrapper; LF endings on every platform.
+        data = content.encode("utf-8")
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    try:
+        with open(key_path, "w", encoding="ascii") as f:
+            f.write(key)
+    except OSError:
+        pass
 
 if __name__ == "__main__":
     generate_world_profile("WORLD.md")
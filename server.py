@@ -17,18 +17,24 @@ import sys
 import threading
 import time
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Optional
 
 from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, HTMLResponse, FileResponse
+from starlette.responses import JSONResponse as _StarletteJSONResponse, HTMLResponse, FileResponse
 from starlette.routing import Route, Mount, WebSocketRoute
 from starlette.staticfiles import StaticFiles
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
 import uvicorn
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -60,31 +66,68 @@ RESTART_EXIT_CODE = 42
 PANIC_EXIT_CODE = 99
 _restart_requested = threading.Event()
 
+# ---------------------------------------------------------------------------
+# JSON serialization (orjson when installed)
+# ---------------------------------------------------------------------------
+def _dumps_text(obj: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+class JSONResponse(_StarletteJSONResponse):
+    """Starlette JSONResponse rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass
+        return super().render(content)
+
+
 # ---------------------------------------------------------------------------
 # WebSocket connections manager
 # ---------------------------------------------------------------------------
-_ws_clients: List[WebSocket] = []
+_ws_clients: set[WebSocket] = set()
 _ws_lock = threading.Lock()
+_WS_SEND_TIMEOUT_SEC = 2.0
+_ws_close_tasks: set[asyncio.Future] = set()  # strong refs until done
 
 
 async def broadcast_ws(msg: dict) -> None:
     """Send a message to all connected WebSocket clients."""
-    data = json.dumps(msg, ensure_ascii=False, default=str)
     with _ws_lock:
-        clients = list(_ws_clients)
-    dead = []
-    for ws in clients:
-        try:
-            await ws.send_text(data)
-        except Exception:
-            dead.append(ws)
+        clients = tuple(_ws_clients)
+    if not clients:
+        return
+    data = _dumps_text(msg)  # serialized once for all clients
+    # Concurrent sends with a per-client deadline: one stalled tab must not hold
+    # up delivery to the others.
+    results = await asyncio.gather(
+        *(asyncio.wait_for(ws.send_text(data), _WS_SEND_TIMEOUT_SEC) for ws in clients),
+        return_exceptions=True,
+    )
+    dead = [ws for ws, r in zip(clients, results) if isinstance(r, Exception)]
     if dead:
         with _ws_lock:
-            for ws in dead:
-                try:
-                    _ws_clients.remove(ws)
-                except ValueError:
-                    pass
+            _ws_clients.difference_update(dead)
+        for ws in dead:
+            # Close so the page notices and reconnects instead of going stale.
+            task = asyncio.ensure_future(_close_ws_quietly(ws))
+            _ws_close_tasks.add(task)
+            task.add_done_callback(_ws_close_tasks.discard)
+
+
+async def _close_ws_quietly(ws: WebSocket) -> None:
+    try:
+        await asyncio.wait_for(ws.close(), _WS_SEND_TIMEOUT_SEC)
+    except Exception:
+        log.debug("Failed to close dropped WebSocket client", exc_info=True)
 
 
 def broadcast_ws_sync(msg: dict) -> None:
@@ -115,6 +158,17 @@ from ouroboros.config import (
 # ---------------------------------------------------------------------------
 # Supervisor integration
 # ---------------------------------------------------------------------------
+def _configure_remote_from_settings(settings: dict) -> None:
+    """Point origin at GITHUB_REPO if both repo slug and token are set."""
+    repo_slug = str(settings.get("GITHUB_REPO") or "").strip()
+    token = str(settings.get("GITHUB_TOKEN") or "").strip()
+    if repo_slug and token:
+        from supervisor.git_ops import configure_remote
+        ok, msg = configure_remote(repo_slug, token)
+        if not ok:
+            log.warning("GitHub remote not configured: %s", msg)
+
+
 _supervisor_ready = threading.Event()
 _supervisor_error: Optional[str] = None
 _event_loop: Optional[asyncio.AbstractEventLoop] = None
@@ -127,6 +181,8 @@ def _run_supervisor(settings: dict) -> None:
     _apply_settings_to_env(settings)
 
     try:
+        # Parsed inside the try: a bad saved value must surface as _supervisor_error.
+        total_budget = float(settings.get("TOTAL_BUDGET", 10.0))
         from supervisor.message_bus import init as bus_init
         from supervisor.message_bus import LocalChatBridge
 
@@ -138,14 +194,15 @@ def _run_supervisor(settings: dict) -> None:
 
         bus_init(
             drive_root=DATA_DIR,
-            total_budget_limit=float(settings.get("TOTAL_BUDGET", 10.0)),
+            total_budget_limit=total_budget,
             budget_report_every=10,
             chat_bridge=bridge,
         )
 
         from supervisor.state import init as state_init, init_state, load_state, save_state
         from supervisor.state import append_jsonl, update_budget_from_usage, rotate_chat_log_if_needed
-        state_init(DATA_DIR, float(settings.get("TOTAL_BUDGET", 10.0)))
+        from ouroboros.utils import append_jsonl_async, flush_jsonl_async, utc_now_iso
+        state_init(DATA_DIR, total_budget)
         init_state()
 
         from supervisor.git_ops import init as git_ops_init, ensure_repo_present, safe_restart
@@ -154,11 +211,7 @@ def _run_supervisor(settings: dict) -> None:
             branch_dev="ouroboros", branch_stable="ouroboros-stable",
         )
         ensure_repo_present()
-        _repo_slug = settings.get("GITHUB_REPO", "")
-        _gh_token = settings.get("GITHUB_TOKEN", "")
-        if _repo_slug and _gh_token:
-            from supervisor.git_ops import configure_remote
-            configure_remote(_repo_slug, _gh_token)
+        _configure_remote_from_settings(settings)
         ok, msg = safe_restart(reason="bootstrap", unsynced_policy="rescue_and_reset")
         if not ok:
             log.error("Supervisor bootstrap failed: %s", msg)
@@ -166,12 +219,12 @@ def _run_supervisor(settings: dict) -> None:
         from supervisor.queue import (
             enqueue_task, enforce_task_timeouts, enqueue_evolution_task_if_needed,
             persist_queue_snapshot, restore_pending_from_snapshot,
-            cancel_task_by_id, queue_review_task, sort_pending,
+            cancel_task_by_id, queue_review_task, sort_pending, drop_pending_of_type,
         )
         from supervisor.workers import (
             init as workers_init, get_event_q, WORKERS, PENDING, RUNNING,
             spawn_workers, kill_workers, assign_tasks, ensure_workers_healthy,
-            handle_chat_direct, _get_chat_agent, auto_resume_after_restart,
+            auto_resume_after_restart,
         )
 
         max_workers = int(settings.get("OUROBOROS_MAX_WORKERS", 5))
@@ -181,12 +234,12 @@ def _run_supervisor(settings: dict) -> None:
         workers_init(
             repo_dir=REPO_DIR, drive_root=DATA_DIR, max_workers=max_workers,
             soft_timeout=soft_timeout, hard_timeout=hard_timeout,
-            total_budget_limit=float(settings.get("TOTAL_BUDGET", 10.0)),
+            total_budget_limit=total_budget,
             branch_dev="ouroboros", branch_stable="ouroboros-stable",
         )
 
-        from supervisor.events import dispatch_event
         from supervisor.message_bus import send_with_budget
+        from supervisor.commands import flush_state_patch
         from ouroboros.consciousness import BackgroundConsciousness
         import types
         import queue as _queue_mod
@@ -204,13 +257,22 @@ def _run_supervisor(settings: dict) -> None:
 
         auto_resume_after_restart()
 
+        # owner_chat_id is set once by the first owner message and then never
+        # changes, so background tool calls reuse it instead of loading state.
+        _owner_chat_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+
         def _get_owner_chat_id() -> Optional[int]:
+            now = time.monotonic()
+            if _owner_chat_cache["value"] is not None and now < _owner_chat_cache["expires"]:
+                return _owner_chat_cache["value"]
             try:
                 st = load_state()
                 cid = st.get("owner_chat_id")
-                return int(cid) if cid else None
+                value = int(cid) if cid else None
             except Exception:
                 return None
+            _owner_chat_cache.update(value=value, expires=now + 60.0)
+            return value
 
         _consciousness = BackgroundConsciousness(
             drive_root=DATA_DIR, repo_dir=REPO_DIR,
@@ -229,11 +291,17 @@ def _run_supervisor(settings: dict) -> None:
             MAX_WORKERS=max_workers,
             send_with_budget=send_with_budget, load_state=load_state, save_state=save_state,
             update_budget_from_usage=update_budget_from_usage, append_jsonl=append_jsonl,
+            # supervisor.jsonl diagnostics may be batched (and dropped under load);
+            # audit rows such as llm_usage go through the synchronous append_jsonl.
+            append_telemetry=append_jsonl_async,
             enqueue_task=enqueue_task, cancel_task_by_id=cancel_task_by_id,
             queue_review_task=queue_review_task, persist_queue_snapshot=persist_queue_snapshot,
             safe_restart=safe_restart, kill_workers=kill_workers, spawn_workers=spawn_workers,
-            sort_pending=sort_pending, consciousness=_consciousness,
+            sort_pending=sort_pending, drop_pending_of_type=drop_pending_of_type,
+            consciousness=_consciousness,
             request_restart=_request_restart_exit,
+            panic_stop=lambda: _execute_panic_stop(_consciousness, kill_workers),
+            SOFT_TIMEOUT=soft_timeout, HARD_TIMEOUT=hard_timeout,
         )
     except Exception as exc:
         _supervisor_error = f"Supervisor init failed: {exc}"
@@ -244,121 +312,53 @@ def _run_supervisor(settings: dict) -> None:
     _supervisor_ready.set()
     log.info("Supervisor ready.")
 
-    # Main supervisor loop
-    offset = 0
+    # Main supervisor loop. Owner messages are pumped into the worker event queue,
+    # so the loop blocks on a single wakeup source instead of polling + sleeping.
+    threading.Thread(
+        target=_pump_owner_messages, args=(bridge, get_event_q),
+        name="owner-message-pump", daemon=True,
+    ).start()
     crash_count = 0
     while not _restart_requested.is_set():
         try:
-            rotate_chat_log_if_needed(DATA_DIR)
-            ensure_workers_healthy()
+            # Chat rotation is a size check and worker health probes every proc,
+            # so neither needs to run on each loop tick.
+            if _due("rotate_chat_log", 30.0):
+                rotate_chat_log_if_needed(DATA_DIR)
+            if _due("worker_health", 2.0):
+                ensure_workers_healthy()
 
             event_q = get_event_q()
-            while True:
+            try:
+                evt = event_q.get(timeout=1.0)
+            except _queue_mod.Empty:
+                evt = None
+            # One timestamp per burst; only refreshed if draining takes over a second.
+            if evt is not None:
+                burst_started = time.monotonic()
+                burst_iso = utc_now_iso()
+            while evt is not None:
+                if time.monotonic() - burst_started > 1.0:
+                    burst_started = time.monotonic()
+                    burst_iso = utc_now_iso()
+                _dispatch_supervisor_event(evt, _event_ctx, burst_iso)
                 try:
                     evt = event_q.get_nowait()
                 except _queue_mod.Empty:
-                    break
-                if evt.get("type") == "restart_request":
-                    _handle_restart_in_supervisor(evt, _event_ctx)
-                    continue
-                dispatch_event(evt, _event_ctx)
-
-            enforce_task_timeouts()
-            enqueue_evolution_task_if_needed()
+                    evt = None
+            flush_state_patch(_event_ctx)
+
+            # Timeouts tick in seconds and the snapshot is crash-recovery only, so
+            # these run on coarse timers; task assignment stays per-iteration.
+            if _due("timeouts", 2.0):
+                enforce_task_timeouts()
+            if _due("evolution", 5.0):
+                enqueue_evolution_task_if_needed()
             assign_tasks()
-            persist_queue_snapshot(reason="main_loop")
-
-            # Process messages from WebSocket bridge
-            updates = bridge.get_updates(offset=offset, timeout=1)
-            for upd in updates:
-                offset = int(upd["update_id"]) + 1
-                msg = upd.get("message") or {}
-                if not msg:
-                    continue
-
-                chat_id = 1
-                user_id = 1
-                text = str(msg.get("text") or "")
-                now_iso = datetime.now(timezone.utc).isoformat()
-
-                st = load_state()
-                if st.get("owner_id") is None:
-                    st["owner_id"] = user_id
-                    st["owner_chat_id"] = chat_id
-
-                from supervisor.message_bus import log_chat
-                log_chat("in", chat_id, user_id, text)
-                st["last_owner_message_at"] = now_iso
-                save_state(st)
-
-                if not text:
-                    continue
-
-                lowered = text.strip().lower()
-                if lowered.startswith("/panic"):
-                    send_with_budget(chat_id, "🛑 PANIC: killing everything. App will close.")
-                    _execute_panic_stop(_consciousness, kill_workers)
-                elif lowered.startswith("/restart"):
-                    send_with_budget(chat_id, "♻️ Restarting (soft).")
-                    ok, restart_msg = safe_restart(reason="owner_restart", unsynced_policy="rescue_and_reset")
-                    if not ok:
-                        send_with_budget(chat_id, f"⚠️ Restart cancelled: {restart_msg}")
-                        continue
-                    kill_workers()
-                    _request_restart_exit()
-                elif lowered.startswith("/review"):
-                    queue_review_task(reason="owner:/review", force=True)
-                elif lowered.startswith("/evolve"):
-                    parts = lowered.split()
-                    action = parts[1] if len(parts) > 1 else "on"
-                    turn_on = action not in ("off", "stop", "0")
-                    st2 = load_state()
-                    st2["evolution_mode_enabled"] = bool(turn_on)
-                    if turn_on:
-                        st2["evolution_consecutive_failures"] = 0
-                    save_state(st2)
-                    if not turn_on:
-                        PENDING[:] = [t for t in PENDING if str(t.get("type")) != "evolution"]
-                        sort_pending()
-                        persist_queue_snapshot(reason="evolve_off")
-                    state_str = "ON" if turn_on else "OFF"
-                    send_with_budget(chat_id, f"🧬 Evolution: {state_str}")
-                elif lowered.startswith("/bg"):
-                    parts = lowered.split()
-                    action = parts[1] if len(parts) > 1 else "status"
-                    if action in ("start", "on", "1"):
-                        result = _consciousness.start()
-                        _bg_s = load_state(); _bg_s["bg_consciousness_enabled"] = True; save_state(_bg_s)
-                        send_with_budget(chat_id, f"🧠 {result}")
-                    elif action in ("stop", "off", "0"):
-                        result = _consciousness.stop()
-                        _bg_s = load_state(); _bg_s["bg_consciousness_enabled"] = False; save_state(_bg_s)
-                        send_with_budget(chat_id, f"🧠 {result}")
-                    else:
-                        bg_status = "running" if _consciousness.is_running else "stopped"
-                        send_with_budget(chat_id, f"🧠 Background consciousness: {bg_status}")
-                elif lowered.startswith("/status"):
-                    from supervisor.state import status_text
-                    status = status_text(WORKERS, PENDING, RUNNING, soft_timeout, hard_timeout)
-                    send_with_budget(chat_id, status, force_budget=True)
-                else:
-                    _consciousness.inject_observation(f"Owner message: {text[:100]}")
-                    agent = _get_chat_agent()
-                    if agent._busy:
-                        agent.inject_message(text)
-                    else:
-                        _consciousness.pause()
-                        def _run_and_resume(cid, txt):
-                            try:
-                                handle_chat_direct(cid, txt, None)
-                            finally:
-                                _consciousness.resume()
-                        threading.Thread(
-                            target=_run_and_resume, args=(chat_id, text), daemon=True,
-                        ).start()
+            if _due("queue_snapshot", 10.0):
+                persist_queue_snapshot(reason="main_loop", only_if_changed=True)
 
             crash_count = 0
-            time.sleep(0.5)
 
         except Exception as exc:
             crash_count += 1
@@ -368,6 +368,48 @@ def _run_supervisor(settings: dict) -> None:
                 return
             time.sleep(min(30, 2 ** crash_count))
 
+    flush_state_patch(_event_ctx)
+    flush_jsonl_async()
+
+
+# Next run time (time.monotonic) per periodic main-loop job
+_next_due: Dict[str, float] = {}
+
+
+def _due(job: str, interval: float) -> bool:
+    """True at most once per `interval` seconds for `job` (first call is always due)."""
+    now = time.monotonic()
+    if now < _next_due.get(job, 0.0):
+        return False
+    _next_due[job] = now + interval
+    return True
+
+
+def _pump_owner_messages(bridge: Any, get_event_q: Callable[[], Any]) -> None:
+    """Forward UI chat messages from the bridge into the worker event queue."""
+    offset = 0
+    while not _restart_requested.is_set():
+        try:
+            for upd in bridge.get_updates(offset=offset, timeout=1):
+                offset = int(upd["update_id"]) + 1
+                # Re-fetched per message: kill_workers/spawn_workers may replace the queue
+                get_event_q().put({"type": "owner_update", "update": upd})
+        except Exception:
+            log.warning("Owner message pump error", exc_info=True)
+            time.sleep(1)
+
+
+def _dispatch_supervisor_event(evt: Dict[str, Any], ctx: Any, now_iso: Optional[str] = None) -> None:
+    event_type = evt.get("type")
+    if event_type == "owner_update":
+        from supervisor.commands import handle_owner_update
+        handle_owner_update(evt.get("update") or {}, ctx, now_iso=now_iso)
+    elif event_type == "restart_request":
+        _handle_restart_in_supervisor(evt, ctx)
+    else:
+        from supervisor.events import dispatch_event
+        dispatch_event(evt, ctx)
+
 
 def _handle_restart_in_supervisor(evt: Dict[str, Any], ctx: Any) -> None:
     """Handle restart request from agent — graceful shutdown + exit(42)."""
@@ -458,7 +500,7 @@ APP_START = time.time()
 async def ws_endpoint(websocket: WebSocket) -> None:
     await websocket.accept()
     with _ws_lock:
-        _ws_clients.append(websocket)
+        _ws_clients.add(websocket)
     log.info("WebSocket client connected (total: %d)", len(_ws_clients))
     try:
         while True:
@@ -487,10 +529,7 @@ async def ws_endpoint(websocket: WebSocket) -> None:
         log.debug("WebSocket error: %s", e)
     finally:
         with _ws_lock:
-            try:
-                _ws_clients.remove(websocket)
-            except ValueError:
-                pass
+            _ws_clients.discard(websocket)
         log.info("WebSocket client disconnected (total: %d)", len(_ws_clients))
 
 
@@ -509,12 +548,12 @@ async def api_health(request: Request) -> JSONResponse:
 async def api_state(request: Request) -> JSONResponse:
     try:
         from supervisor.state import load_state, budget_remaining, budget_pct, TOTAL_BUDGET_LIMIT
-        from supervisor.workers import WORKERS, PENDING, RUNNING
+        from supervisor.workers import WORKERS, PENDING, RUNNING, alive_count
         st = load_state()
         alive = 0
         total_w = 0
         try:
-            alive = sum(1 for w in WORKERS.values() if w.proc.is_alive())
+            alive = alive_count()
             total_w = len(WORKERS)
         except Exception:
             pass
@@ -560,11 +599,7 @@ async def api_settings_post(request: Request) -> JSONResponse:
                 current[key] = body[key]
         save_settings(current)
         _apply_settings_to_env(current)
-        _repo_slug = current.get("GITHUB_REPO", "")
-        _gh_token = current.get("GITHUB_TOKEN", "")
-        if _repo_slug and _gh_token:
-            from supervisor.git_ops import configure_remote
-            configure_remote(_repo_slug, _gh_token)
+        _configure_remote_from_settings(current)
         return JSONResponse({"status": "saved"})
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=400)
@@ -583,6 +618,8 @@ async def api_reset(request: Request) -> JSONResponse:
             if p.exists():
                 shutil.rmtree(p, ignore_errors=True)
                 deleted.append(subdir)
+        from ouroboros.utils import forget_ensured_dirs
+        forget_ensured_dirs()
         settings_file = DATA_DIR / "settings.json"
         if settings_file.exists():
             settings_file.unlink()
@@ -680,72 +717,92 @@ async def index_page(request: Request) -> FileResponse:
 from ouroboros.config import read_version as _read_version
 
 
-async def api_cost_breakdown(request: Request) -> JSONResponse:
-    """Aggregate llm_usage events from events.jsonl into cost breakdowns."""
-    events_path = DATA_DIR / "logs" / "events.jsonl"
-    by_model: Dict[str, Dict[str, Any]] = {}
-    by_api_key: Dict[str, Dict[str, Any]] = {}
-    by_model_category: Dict[str, Dict[str, Any]] = {}
-    by_task_category: Dict[str, Dict[str, Any]] = {}
-    total_cost = 0.0
-    total_calls = 0
-
-    def _acc(d, key):
-        if key not in d:
-            d[key] = {"cost": 0.0, "calls": 0}
-        return d[key]
+# Running llm_usage aggregates over events.jsonl. Each request only parses the
+# bytes appended since the previous one; the state resets when the file is
+# replaced or shrinks (rotation, /api/reset).
+_COST_GROUPS = ("by_model", "by_api_key", "by_model_category", "by_task_category")
+_cost_lock = threading.Lock()
 
-    try:
-        if events_path.exists():
-            with events_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        evt = json.loads(line)
-                    except Exception:
-                        continue
-                    if evt.get("type") != "llm_usage":
-                        continue
-                    cost = float(evt.get("cost") or 0)
-                    model = str(evt.get("model") or "unknown")
-                    api_key_type = str(evt.get("api_key_type") or evt.get("provider") or "openrouter")
-                    model_cat = str(evt.get("model_category") or "other")
-                    task_cat = str(evt.get("category") or "task")
 
-                    total_cost += cost
-                    total_calls += 1
+def _new_cost_state() -> Dict[str, Any]:
+    state: Dict[str, Any] = {"ino": None, "offset": 0, "total_cost": 0.0, "total_calls": 0}
+    for group in _COST_GROUPS:
+        state[group] = {}
+    return state
 
-                    e = _acc(by_model, model)
-                    e["cost"] += cost
-                    e["calls"] += 1
 
-                    e = _acc(by_api_key, api_key_type)
-                    e["cost"] += cost
-                    e["calls"] += 1
+_cost_state = _new_cost_state()
+_loads_event = orjson.loads if orjson is not None else json.loads
 
-                    e = _acc(by_model_category, model_cat)
-                    e["cost"] += cost
-                    e["calls"] += 1
 
-                    e = _acc(by_task_category, task_cat)
-                    e["cost"] += cost
-                    e["calls"] += 1
-    except Exception:
-        pass
+def _acc_cost(d: Dict[str, Dict[str, Any]], key: str, cost: float) -> None:
+    e = d.get(key)
+    if e is None:
+        e = d[key] = {"cost": 0.0, "calls": 0}
+    e["cost"] += cost
+    e["calls"] += 1
 
-    def _sorted(d):
-        return dict(sorted(d.items(), key=lambda x: x[1]["cost"], reverse=True))
 
-    return JSONResponse({
-        "total_cost": round(total_cost, 4),
-        "total_calls": total_calls,
-        "by_model": _sorted(by_model),
-        "by_api_key": _sorted(by_api_key),
-        "by_model_category": _sorted(by_model_category),
-        "by_task_category": _sorted(by_task_category),
-    })
+def _scan_cost_events(events_path: pathlib.Path) -> Dict[str, Any]:
+    """Fold new events.jsonl lines into _cost_state and return a sorted snapshot."""
+    global _cost_state
+    with _cost_lock:
+        state = _cost_state
+        try:
+            st = events_path.stat()
+        except OSError:
+            st = None
+        if st is None or st.st_ino != state["ino"] or st.st_size < state["offset"]:
+            state = _cost_state = _new_cost_state()
+            state["ino"] = st.st_ino if st is not None else None
+
+        if st is not None and st.st_size > state["offset"]:
+            try:
+                with events_path.open("rb") as f:
+                    f.seek(state["offset"])
+                    chunk = f.read(st.st_size - state["offset"])
+            except OSError:
+                chunk = b""
+            # A writer may be mid-append: leave the unterminated tail for next time.
+            end = chunk.rfind(b"\n") + 1
+            state["offset"] += end
+            for line in chunk[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    evt = _loads_event(line)
+                except ValueError:
+                    continue
+                if not isinstance(evt, dict) or evt.get("type") != "llm_usage":
+                    continue
+                try:
+                    cost = float(evt.get("cost") or 0)
+                except (TypeError, ValueError):
+                    continue
+                state["total_cost"] += cost
+                state["total_calls"] += 1
+                _acc_cost(state["by_model"], str(evt.get("model") or "unknown"), cost)
+                _acc_cost(state["by_api_key"],
+                          str(evt.get("api_key_type") or evt.get("provider") or "openrouter"), cost)
+                _acc_cost(state["by_model_category"], str(evt.get("model_category") or "other"), cost)
+                _acc_cost(state["by_task_category"], str(evt.get("category") or "task"), cost)
+
+        result: Dict[str, Any] = {
+            "total_cost": round(state["total_cost"], 4),
+            "total_calls": state["total_calls"],
+        }
+        for group in _COST_GROUPS:
+            result[group] = {
+                k: dict(v)
+                for k, v in sorted(state[group].items(), key=lambda x: x[1]["cost"], reverse=True)
+            }
+        return result
+
+
+async def api_cost_breakdown(request: Request) -> JSONResponse:
+    """Aggregate llm_usage events from events.jsonl into cost breakdowns."""
+    events_path = DATA_DIR / "logs" / "events.jsonl"
+    return JSONResponse(await asyncio.to_thread(_scan_cost_events, events_path))
 
 
 # ---------------------------------------------------------------------------
@@ -872,7 +929,13 @@ async def lifespan(app):
         pass
 
 
-app = Starlette(routes=routes, lifespan=lifespan)
+# Gzip only HTTP responses big enough to matter (cost breakdown, git log, state);
+# level 1 keeps the CPU cost negligible. WebSocket traffic is not touched.
+app = Starlette(
+    routes=routes,
+    lifespan=lifespan,
+    middleware=[Middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)],
+)
 
 
 # ---------------------------------------------------------------------------
@@ -917,13 +980,14 @@ if __name__ == "__main__":
         log.info("Port %d busy, using %d instead", PORT, actual_port)
     _write_port_file(actual_port)
     log.info("Starting Ouroboros server on port %d", actual_port)
-    config = uvicorn.Config(app, host="127.0.0.1", port=actual_port, log_level="warning")
+    # Chat/log frames are small and latency-sensitive: no permessage-deflate.
+    config = uvicorn.Config(app, host="127.0.0.1", port=actual_port, log_level="warning",
+                            ws_per_message_deflate=False)
     server = uvicorn.Server(config)
 
     def _check_restart():
         """Monitor for restart signal, then shut down uvicorn."""
-        while not _restart_requested.is_set():
-            time.sleep(0.5)
+        _restart_requested.wait()
         log.info("Restart requested — shutting down server.")
         server.should_exit = True
 
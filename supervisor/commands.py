@@ -0,0 +1,180 @@
+"""
+Supervisor — Owner chat commands.
+
+Routes owner messages from the supervisor loop: slash commands are looked up
+in SUPERVISOR_COMMANDS, everything else goes to the direct-chat agent.
+Handlers take the same ctx namespace as supervisor.events.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ouroboros.utils import utc_now_iso
+
+log = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Coalesced state writes
+# ---------------------------------------------------------------------------
+# Owner-message bookkeeping is coalesced and written once per loop iteration
+# (one load/save for a whole burst) instead of a full state write per message.
+_state_patch: Dict[str, Any] = {}
+_state_patch_defaults: Dict[str, Any] = {}
+_state_patch_lock = threading.Lock()
+
+
+def mark_state(fields: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> None:
+    """Queue state updates; `defaults` are only applied to keys that are unset (None)."""
+    with _state_patch_lock:
+        _state_patch.update(fields)
+        for k, v in (defaults or {}).items():
+            _state_patch_defaults.setdefault(k, v)
+
+
+def flush_state_patch(ctx: Any) -> None:
+    with _state_patch_lock:
+        if not _state_patch and not _state_patch_defaults:
+            return
+        patch, defaults = dict(_state_patch), dict(_state_patch_defaults)
+        _state_patch.clear()
+        _state_patch_defaults.clear()
+    st = ctx.load_state()
+    for k, v in defaults.items():
+        if st.get(k) is None:
+            st[k] = v
+    st.update(patch)
+    ctx.save_state(st)
+
+
+# ---------------------------------------------------------------------------
+# Slash commands (dispatched on the first token of the message)
+# ---------------------------------------------------------------------------
+def _cmd_panic(ctx: Any, chat_id: int, args: List[str]) -> None:
+    ctx.send_with_budget(chat_id, "🛑 PANIC: killing everything. App will close.")
+    ctx.panic_stop()
+
+
+def _cmd_restart(ctx: Any, chat_id: int, args: List[str]) -> None:
+    ctx.send_with_budget(chat_id, "♻️ Restarting (soft).")
+    ok, restart_msg = ctx.safe_restart(reason="owner_restart", unsynced_policy="rescue_and_reset")
+    if not ok:
+        ctx.send_with_budget(chat_id, f"⚠️ Restart cancelled: {restart_msg}")
+        return
+    ctx.kill_workers()
+    ctx.request_restart()
+
+
+def _cmd_review(ctx: Any, chat_id: int, args: List[str]) -> None:
+    ctx.queue_review_task(reason="owner:/review", force=True)
+
+
+def _cmd_evolve(ctx: Any, chat_id: int, args: List[str]) -> None:
+    action = args[0] if args else "on"
+    turn_on = action not in ("off", "stop", "0")
+    st = ctx.load_state()
+    st["evolution_mode_enabled"] = bool(turn_on)
+    if turn_on:
+        st["evolution_consecutive_failures"] = 0
+    ctx.save_state(st)
+    if not turn_on and ctx.drop_pending_of_type("evolution"):
+        ctx.persist_queue_snapshot(reason="evolve_off")
+    state_str = "ON" if turn_on else "OFF"
+    ctx.send_with_budget(chat_id, f"🧬 Evolution: {state_str}")
+
+
+def _cmd_bg(ctx: Any, chat_id: int, args: List[str]) -> None:
+    action = args[0] if args else "status"
+    consciousness = ctx.consciousness
+    if action in ("start", "on", "1"):
+        result = consciousness.start()
+        st = ctx.load_state(); st["bg_consciousness_enabled"] = True; ctx.save_state(st)
+        ctx.send_with_budget(chat_id, f"🧠 {result}")
+    elif action in ("stop", "off", "0"):
+        result = consciousness.stop()
+        st = ctx.load_state(); st["bg_consciousness_enabled"] = False; ctx.save_state(st)
+        ctx.send_with_budget(chat_id, f"🧠 {result}")
+    else:
+        bg_status = "running" if consciousness.is_running else "stopped"
+        ctx.send_with_budget(chat_id, f"🧠 Background consciousness: {bg_status}")
+
+
+def _cmd_status(ctx: Any, chat_id: int, args: List[str]) -> None:
+    from supervisor.state import status_text
+    status = status_text(ctx.WORKERS, ctx.PENDING, ctx.RUNNING, ctx.SOFT_TIMEOUT, ctx.HARD_TIMEOUT)
+    ctx.send_with_budget(chat_id, status, force_budget=True)
+
+
+SUPERVISOR_COMMANDS: Dict[str, Callable[[Any, int, List[str]], None]] = {
+    "/panic": _cmd_panic,
+    "/restart": _cmd_restart,
+    "/review": _cmd_review,
+    "/evolve": _cmd_evolve,
+    "/bg": _cmd_bg,
+    "/status": _cmd_status,
+}
+
+
+def _parse_command(text: str) -> Optional[Tuple[str, str]]:
+    """Split "/cmd rest" into (lowercased cmd, rest); None for non-command text."""
+    s = text.strip()
+    if not s.startswith("/"):
+        return None
+    head, *rest = s.split(None, 1)
+    return head.lower(), (rest[0] if rest else "")
+
+
+# ---------------------------------------------------------------------------
+# Owner message entry point
+# ---------------------------------------------------------------------------
+def handle_owner_update(upd: Dict[str, Any], ctx: Any, now_iso: Optional[str] = None) -> None:
+    """Log an owner message, then run it as a slash command or hand it to the chat agent.
+
+    `now_iso` lets the supervisor loop share one timestamp across a burst of messages.
+    """
+    msg = upd.get("message") or {}
+    if not msg:
+        return
+
+    chat_id = 1
+    user_id = 1
+    text = str(msg.get("text") or "")
+    now_iso = now_iso or utc_now_iso()
+
+    from supervisor.message_bus import log_chat
+    log_chat("in", chat_id, user_id, text, ts=now_iso)
+    mark_state({"last_owner_message_at": now_iso},
+                defaults={"owner_id": user_id, "owner_chat_id": chat_id})
+
+    if not text:
+        return
+
+    parsed = _parse_command(text)
+    handler = SUPERVISOR_COMMANDS.get(parsed[0]) if parsed else None
+    if handler is not None:
+        # Handlers (e.g. /review -> queue_review_task) read owner ids from disk;
+        # on a fresh state those are still only in the pending patch.
+        flush_state_patch(ctx)
+        handler(ctx, chat_id, parsed[1].lower().split())
+        return
+
+    from supervisor.workers import _get_chat_agent, handle_chat_direct
+    consciousness = ctx.consciousness
+    consciousness.inject_observation(f"Owner message: {text[:100]}")
+    agent = _get_chat_agent()
+    if agent._busy:
+        agent.inject_message(text)
+        return
+
+    consciousness.pause()
+
+    def _run_and_resume(cid, txt):
+        try:
+            handle_chat_direct(cid, txt, None)
+        finally:
+            consciousness.resume()
+
+    threading.Thread(target=_run_and_resume, args=(chat_id, text), daemon=True).start()
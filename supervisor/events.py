@@ -7,6 +7,7 @@ Extracted from colab_launcher.py main loop to keep it under 500 lines.
 
 from __future__ import annotations
 
+import concurrent.futures
 import datetime
 import json
 import logging
@@ -20,6 +21,10 @@ from typing import Any, Dict, Optional
 
 log = logging.getLogger(__name__)
 
+# Network round-trips (git push) run here so they never block the supervisor
+# loop; a single worker keeps pushes in the order they were requested.
+_NETWORK_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="events-net")
+
 
 def _handle_llm_usage(evt: Dict[str, Any], ctx: Any) -> None:
     usage_raw = evt.get("usage")
@@ -71,9 +76,9 @@ def _handle_llm_usage(evt: Dict[str, Any], ctx: Any) -> None:
     ctx.update_budget_from_usage(usage_for_budget)
 
     # Log to events.jsonl for audit trail
-    from ouroboros.utils import utc_now_iso, append_jsonl
+    from ouroboros.utils import utc_now_iso
     try:
-        append_jsonl(ctx.DRIVE_ROOT / "logs" / "events.jsonl", {
+        ctx.append_jsonl(ctx.DRIVE_ROOT / "logs" / "events.jsonl", {
             "ts": evt.get("ts", utc_now_iso()),
             "type": "llm_usage",
             "task_id": evt.get("task_id", ""),
@@ -122,7 +127,7 @@ def _handle_send_message(evt: Dict[str, Any], ctx: Any) -> None:
             is_progress=is_progress,
         )
     except Exception as e:
-        ctx.append_jsonl(
+        ctx.append_telemetry(
             ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -156,7 +161,7 @@ def _handle_task_done(evt: Dict[str, Any], ctx: Any) -> None:
             failures = int(st.get("evolution_consecutive_failures") or 0) + 1
             st["evolution_consecutive_failures"] = failures
             ctx.save_state(st)
-            ctx.append_jsonl(
+            ctx.append_telemetry(
                 ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
                 {
                     "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -197,7 +202,7 @@ def _handle_task_done(evt: Dict[str, Any], ctx: Any) -> None:
 
 
 def _handle_task_metrics(evt: Dict[str, Any], ctx: Any) -> None:
-    ctx.append_jsonl(
+    ctx.append_telemetry(
         ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
         {
             "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -235,25 +240,35 @@ def _handle_promote_to_stable(evt: Dict[str, Any], ctx: Any) -> None:
             ctx.send_with_budget(int(st["owner_chat_id"]), f"❌ Failed to promote to stable: {e}")
         return
 
+    _NETWORK_POOL.submit(_push_stable_and_report, ctx, new_sha)
+
+
+def _push_stable_and_report(ctx: Any, new_sha: str) -> None:
+    import subprocess as sp
     # Optional remote push (silently skip if no remote configured)
     remote_status = ""
     try:
         sp.run(["git", "remote", "get-url", "origin"], cwd=str(ctx.REPO_DIR),
                capture_output=True, check=True)
         sp.run(
-            ["git", "push", "origin", f"{ctx.BRANCH_DEV}:{ctx.BRANCH_STABLE}"],
+            # Push the promoted commit, not the dev tip: dev may have moved on
+            # while this job waited in the pool.
+            ["git", "push", "origin", f"{new_sha}:refs/heads/{ctx.BRANCH_STABLE}"],
             cwd=str(ctx.REPO_DIR), check=True,
         )
         remote_status = " (pushed to origin)"
     except Exception:
         log.debug("No remote or push failed — local-only promote")
 
-    st = ctx.load_state()
-    if st.get("owner_chat_id"):
-        ctx.send_with_budget(
-            int(st["owner_chat_id"]),
-            f"✅ Promoted: {ctx.BRANCH_DEV} → {ctx.BRANCH_STABLE} ({new_sha[:8]}){remote_status}",
-        )
+    try:
+        st = ctx.load_state()
+        if st.get("owner_chat_id"):
+            ctx.send_with_budget(
+                int(st["owner_chat_id"]),
+                f"✅ Promoted: {ctx.BRANCH_DEV} → {ctx.BRANCH_STABLE} ({new_sha[:8]}){remote_status}",
+            )
+    except Exception:
+        log.warning("Failed to report stable promotion", exc_info=True)
 
 
 def _find_duplicate_task(desc: str, pending: list, running: dict) -> Optional[str]:
@@ -366,9 +381,7 @@ def _handle_toggle_evolution(evt: Dict[str, Any], ctx: Any) -> None:
     st = ctx.load_state()
     st["evolution_mode_enabled"] = enabled
     ctx.save_state(st)
-    if not enabled:
-        ctx.PENDING[:] = [t for t in ctx.PENDING if str(t.get("type")) != "evolution"]
-        ctx.sort_pending()
+    if not enabled and ctx.drop_pending_of_type("evolution"):
         ctx.persist_queue_snapshot(reason="evolve_off_via_tool")
     if st.get("owner_chat_id"):
         state_str = "ON" if enabled else "OFF"
@@ -402,7 +415,7 @@ def _handle_send_photo(evt: Dict[str, Any], ctx: Any) -> None:
         photo_bytes = b64mod.b64decode(image_b64)
         ok, err = ctx.bridge.send_photo(chat_id, photo_bytes, caption=caption)
         if not ok:
-            ctx.append_jsonl(
+            ctx.append_telemetry(
                 ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
                 {
                     "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -411,7 +424,7 @@ def _handle_send_photo(evt: Dict[str, Any], ctx: Any) -> None:
                 },
             )
     except Exception as e:
-        ctx.append_jsonl(
+        ctx.append_telemetry(
             ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -458,7 +471,7 @@ EVENT_HANDLERS = {
 def dispatch_event(evt: Dict[str, Any], ctx: Any) -> None:
     """Dispatch a single worker event to its handler."""
     if not isinstance(evt, dict):
-        ctx.append_jsonl(
+        ctx.append_telemetry(
             ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -471,7 +484,7 @@ def dispatch_event(evt: Dict[str, Any], ctx: Any) -> None:
 
     event_type = str(evt.get("type") or "").strip()
     if not event_type:
-        ctx.append_jsonl(
+        ctx.append_telemetry(
             ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -484,7 +497,7 @@ def dispatch_event(evt: Dict[str, Any], ctx: Any) -> None:
 
     handler = EVENT_HANDLERS.get(event_type)
     if handler is None:
-        ctx.append_jsonl(
+        ctx.append_telemetry(
             ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
@@ -498,7 +511,7 @@ def dispatch_event(evt: Dict[str, Any], ctx: Any) -> None:
     try:
         handler(evt, ctx)
     except Exception as e:
-        ctx.append_jsonl(
+        ctx.append_telemetry(
             ctx.DRIVE_ROOT / "logs" / "supervisor.jsonl",
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
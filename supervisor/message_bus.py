@@ -6,12 +6,12 @@ Queue-based message bus that connects the Web UI with the Agent Supervisor.
 
 from __future__ import annotations
 
-import datetime
 import logging
 import queue
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+from ouroboros.utils import utc_now_iso
 from supervisor.state import load_state, save_state, append_jsonl
 
 log = logging.getLogger(__name__)
@@ -44,12 +44,30 @@ def get_bridge() -> "LocalChatBridge":
 # LocalChatBridge
 # ---------------------------------------------------------------------------
 
+def _put_drop_oldest(q: queue.Queue, item: Any) -> None:
+    """Non-blocking put on a bounded queue, evicting the oldest item when full."""
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass
+
+
 class LocalChatBridge:
     """Local message bus using queue.Queue."""
 
     def __init__(self):
         self._inbox = queue.Queue()   # user -> agent
-        self._outbox = queue.Queue()  # agent -> UI
+        # agent -> UI. The web UI is fed over WebSocket and only polls this queue
+        # via ui_receive(), so it is bounded: undrained photos (raw image bytes)
+        # must not accumulate for the lifetime of the server.
+        self._outbox: queue.Queue = queue.Queue(maxsize=200)
         self._log_queue: queue.Queue = queue.Queue(maxsize=1000)
         self._update_counter = 0
         self._broadcast_fn = None  # set by server.py for WebSocket streaming
@@ -75,14 +93,14 @@ class LocalChatBridge:
         """Put a message in the outbox for the UI to consume."""
         clean_text = _strip_markdown(text) if not parse_mode else text
         msg = {"type": "text", "content": clean_text, "markdown": bool(parse_mode)}
-        self._outbox.put(msg)
+        _put_drop_oldest(self._outbox, msg)
         if self._broadcast_fn:
             self._broadcast_fn({"type": "chat", "role": "assistant", "content": clean_text})
         return True, "ok"
 
     def send_chat_action(self, chat_id: int, action: str = "typing") -> bool:
         """Send typing indicator to UI via WebSocket broadcast."""
-        self._outbox.put({
+        _put_drop_oldest(self._outbox, {
             "type": "action",
             "content": action
         })
@@ -93,7 +111,7 @@ class LocalChatBridge:
     def send_photo(self, chat_id: int, photo_bytes: bytes,
                    caption: str = "") -> Tuple[bool, str]:
         """Send photo to UI."""
-        self._outbox.put({
+        _put_drop_oldest(self._outbox, {
             "type": "photo",
             "content": photo_bytes,
             "caption": caption
@@ -107,17 +125,7 @@ class LocalChatBridge:
     # Log streaming
     def push_log(self, event: dict):
         """Called by append_jsonl hook to stream log events to the UI."""
-        try:
-            self._log_queue.put_nowait(event)
-        except queue.Full:
-            try:
-                self._log_queue.get_nowait()
-            except queue.Empty:
-                pass
-            try:
-                self._log_queue.put_nowait(event)
-            except queue.Full:
-                pass
+        _put_drop_oldest(self._log_queue, event)
         if self._broadcast_fn:
             self._broadcast_fn({"type": "log", "data": event})
 
@@ -161,18 +169,25 @@ def split_message(text: str, limit: int = 4000) -> List[str]:
     return chunks
 
 
+# Compiled once at import; _strip_markdown runs on every outgoing chat message.
+_MD_SUBS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"```[^\n]*\n([\s\S]*?)```"), r"\1"),
+    (re.compile(r"`([^`]+)`"), r"\1"),
+    (re.compile(r"\*\*\*(.+?)\*\*\*"), r"\1"),
+    (re.compile(r"\*\*(.+?)\*\*"), r"\1"),
+    (re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)"), r"\1"),
+    (re.compile(r"(?<!\w)_(.+?)_(?!\w)"), r"\1"),
+    (re.compile(r"~~(.+?)~~"), r"\1"),
+    (re.compile(r"\[([^\]]+)\]\([^)]+\)"), r"\1"),
+    (re.compile(r"^#{1,6}\s+", re.MULTILINE), ""),
+    (re.compile(r"^[\*\-]\s+", re.MULTILINE), "• "),
+]
+
+
 def _strip_markdown(text: str) -> str:
     """Strip all markdown formatting markers, leaving only plain text."""
-    text = re.sub(r"```[^\n]*\n([\s\S]*?)```", r"\1", text)
-    text = re.sub(r"`([^`]+)`", r"\1", text)
-    text = re.sub(r"\*\*\*(.+?)\*\*\*", r"\1", text)
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)", r"\1", text)
-    text = re.sub(r"(?<!\w)_(.+?)_(?!\w)", r"\1", text)
-    text = re.sub(r"~~(.+?)~~", r"\1", text)
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^[\*\-]\s+", "• ", text, flags=re.MULTILINE)
+    for pattern, repl in _MD_SUBS:
+        text = pattern.sub(repl, text)
     text = text.replace("**", "").replace("__", "").replace("~~", "")
     text = text.replace("`", "")
     return text
@@ -222,10 +237,11 @@ def budget_line(force: bool = False) -> str:
         return ""
 
 
-def log_chat(direction: str, chat_id: int, user_id: int, text: str) -> None:
+def log_chat(direction: str, chat_id: int, user_id: int, text: str,
+             ts: Optional[str] = None) -> None:
     if DATA_DIR:
         append_jsonl(DATA_DIR / "logs" / "chat.jsonl", {
-            "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "ts": ts or utc_now_iso(),
             "session_id": load_state().get("session_id"),
             "direction": direction,
             "chat_id": chat_id,
@@ -243,7 +259,7 @@ def send_with_budget(chat_id: int, text: str, log_text: Optional[str] = None,
 
     if is_progress and DATA_DIR:
         append_jsonl(DATA_DIR / "logs" / "progress.jsonl", {
-            "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "ts": utc_now_iso(),
             "direction": "out", "chat_id": chat_id, "user_id": owner_id,
             "text": text if log_text is None else log_text,
         })
@@ -13,7 +13,7 @@ import pathlib
 import threading
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from supervisor.state import (
     load_state, save_state, append_jsonl, atomic_write_text,
@@ -90,6 +90,27 @@ def sort_pending() -> None:
     PENDING.sort(key=_queue_sort_key)
 
 
+def prune_pending(keep: Callable[[Dict[str, Any]], bool]) -> int:
+    """Drop PENDING tasks for which keep(task) is false; returns how many were removed.
+
+    Compacts in place (two-pointer), so the shared list object and the
+    relative order of surviving tasks are preserved without building a copy.
+    """
+    write = 0
+    for task in PENDING:
+        if keep(task):
+            PENDING[write] = task
+            write += 1
+    removed = len(PENDING) - write
+    del PENDING[write:]
+    return removed
+
+
+def drop_pending_of_type(task_type: str) -> int:
+    """Remove all pending tasks of the given type (e.g. "evolution")."""
+    return prune_pending(lambda t: str(t.get("type") or "") != task_type)
+
+
 # ---------------------------------------------------------------------------
 # Queue operations
 # ---------------------------------------------------------------------------
@@ -121,8 +142,19 @@ def queue_has_task_type(task_type: str) -> bool:
     return False
 
 
-def persist_queue_snapshot(reason: str = "") -> None:
+# Periodic snapshots are skipped while the queue membership is unchanged, but
+# still refreshed at least this often so runtime/heartbeat figures don't go stale.
+_SNAPSHOT_REFRESH_SEC = 300.0
+_last_snapshot: Dict[str, Any] = {"sig": None, "ts": 0.0}
+
+
+def persist_queue_snapshot(reason: str = "", only_if_changed: bool = False) -> None:
     """Save PENDING and RUNNING to snapshot file."""
+    now = time.time()
+    sig = (tuple(t.get("id") for t in PENDING), tuple(RUNNING))
+    if (only_if_changed and sig == _last_snapshot["sig"]
+            and now - _last_snapshot["ts"] < _SNAPSHOT_REFRESH_SEC):
+        return
     pending_rows = []
     for t in PENDING:
         pending_rows.append({
@@ -137,7 +169,6 @@ def persist_queue_snapshot(reason: str = "") -> None:
             },
         })
     running_rows = []
-    now = time.time()
     for task_id, meta in RUNNING.items():
         task = meta.get("task") if isinstance(meta, dict) else {}
         started = float(meta.get("started_at") or 0.0) if isinstance(meta, dict) else 0.0
@@ -157,6 +188,7 @@ def persist_queue_snapshot(reason: str = "") -> None:
     }
     try:
         atomic_write_text(QUEUE_SNAPSHOT_PATH, json.dumps(payload, ensure_ascii=False, indent=2))
+        _last_snapshot.update(sig=sig, ts=now)
     except Exception:
         log.warning("Failed to persist queue snapshot (reason=%s)", reason, exc_info=True)
         pass
@@ -7,13 +7,17 @@ Persistent state on local disk: load, save, atomic writes, file locks.
 from __future__ import annotations
 
 import datetime
+import itertools
 import json
 import logging
 import os
 import pathlib
+import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from ouroboros.utils import ensure_dir, reensure_dir
 
 log = logging.getLogger(__name__)
 
@@ -30,7 +34,9 @@ QUEUE_SNAPSHOT_PATH: pathlib.Path = DRIVE_ROOT / "state" / "queue_snapshot.json"
 
 def init(drive_root: pathlib.Path, total_budget_limit: float = 0.0) -> None:
     global DRIVE_ROOT, STATE_PATH, STATE_LAST_GOOD_PATH, STATE_LOCK_PATH, QUEUE_SNAPSHOT_PATH
+    global _state_cache
     DRIVE_ROOT = drive_root
+    _state_cache = None
     STATE_PATH = drive_root / "state" / "state.json"
     STATE_LAST_GOOD_PATH = drive_root / "state" / "state.last_good.json"
     STATE_LOCK_PATH = drive_root / "locks" / "state.lock"
@@ -43,9 +49,14 @@ def init(drive_root: pathlib.Path, total_budget_limit: float = 0.0) -> None:
 # ---------------------------------------------------------------------------
 
 def atomic_write_text(path: pathlib.Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(path.parent)
     tmp = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
-    fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    except FileNotFoundError:
+        # Directory removed since ensure_dir cached it (reset, cleanup, sync tools).
+        reensure_dir(path.parent)
+        fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
         data = content.encode("utf-8")
         os.write(fd, data)
@@ -72,7 +83,8 @@ def json_load_file(path: pathlib.Path) -> Optional[Dict[str, Any]]:
 
 def acquire_file_lock(lock_path: pathlib.Path, timeout_sec: float = 4.0,
                       stale_sec: float = 90.0) -> Optional[int]:
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(lock_path.parent)
+    dir_recreated = False
     started = time.time()
     while (time.time() - started) < timeout_sec:
         try:
@@ -93,6 +105,13 @@ def acquire_file_lock(lock_path: pathlib.Path, timeout_sec: float = 4.0,
                 log.debug(f"Failed to check/remove stale lock at {lock_path}", exc_info=True)
                 pass
             time.sleep(0.05)
+        except FileNotFoundError:
+            if dir_recreated:
+                log.warning(f"Failed to acquire lock at {lock_path}", exc_info=True)
+                break
+            # Lock directory removed since ensure_dir cached it; re-create once.
+            reensure_dir(lock_path.parent)
+            dir_recreated = True
         except Exception:
             log.warning(f"Failed to acquire lock at {lock_path}", exc_info=True)
             break
@@ -164,6 +183,26 @@ def default_state_dict() -> Dict[str, Any]:
 # Load / Save
 # ---------------------------------------------------------------------------
 
+# Last state.json this process read or wrote, keyed on (st_ino, st_mtime_ns, st_size).
+# atomic_write_text replaces the file, so any writer (workers included) changes the
+# stamp; while it matches, load_state() skips the lock file, read and parse.
+_state_cache: Optional[Tuple[Tuple[int, int, int], str]] = None
+
+
+def _state_stamp() -> Optional[Tuple[int, int, int]]:
+    try:
+        s = STATE_PATH.stat()
+    except OSError:
+        return None
+    return s.st_ino, s.st_mtime_ns, s.st_size
+
+
+def _remember_state(payload: str) -> None:
+    global _state_cache
+    stamp = _state_stamp()
+    _state_cache = (stamp, payload) if stamp is not None else None
+
+
 def _load_state_unlocked() -> Dict[str, Any]:
     """Load state without acquiring lock. Caller must hold STATE_LOCK."""
     recovered = False
@@ -180,6 +219,8 @@ def _load_state_unlocked() -> Dict[str, Any]:
     st = ensure_state_defaults(st_obj)
     if recovered:
         _save_state_unlocked(st)
+    else:
+        _remember_state(json.dumps(st, ensure_ascii=False))
     return st
 
 
@@ -189,9 +230,13 @@ def _save_state_unlocked(st: Dict[str, Any]) -> None:
     payload = json.dumps(st, ensure_ascii=False, indent=2)
     atomic_write_text(STATE_PATH, payload)
     atomic_write_text(STATE_LAST_GOOD_PATH, payload)
+    _remember_state(payload)
 
 
 def load_state() -> Dict[str, Any]:
+    cached = _state_cache
+    if cached is not None and cached[0] == _state_stamp():
+        return json.loads(cached[1])
     lock_fd = acquire_file_lock(STATE_LOCK_PATH)
     try:
         return _load_state_unlocked()
@@ -211,8 +256,11 @@ def init_state() -> Dict[str, Any]:
     """
     Initialize state at session start, capturing snapshots for budget drift detection.
 
-    Fetches OpenRouter ground truth and stores session_daily_snapshot and
-    session_spent_snapshot for drift calculation.
+    Stores session_spent_snapshot immediately; the OpenRouter ground truth
+    baseline (session_total_snapshot) is fetched in a background thread so the
+    HTTP round-trip does not delay supervisor startup, and is written by the
+    supervisor loop's next state flush. Drift checks skip while
+    session_total_snapshot is still None.
     """
     lock_fd = acquire_file_lock(STATE_LOCK_PATH)
     try:
@@ -220,27 +268,44 @@ def init_state() -> Dict[str, Any]:
 
         # Capture session snapshots for drift detection
         st["session_spent_snapshot"] = float(st.get("spent_usd") or 0.0)
-
-        # Fetch OpenRouter ground truth to capture total_usd baseline
-        ground_truth = check_openrouter_ground_truth()
-        if ground_truth is not None:
-            st["session_total_snapshot"] = ground_truth["total_usd"]
-            st["openrouter_total_usd"] = ground_truth["total_usd"]
-            st["openrouter_daily_usd"] = ground_truth["daily_usd"]
-            st["openrouter_last_check_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        else:
-            # If we can't fetch ground truth, use 0 as baseline
-            st["session_total_snapshot"] = 0.0
+        st["session_total_snapshot"] = None
 
         # Reset drift tracking
         st["budget_drift_pct"] = None
         st["budget_drift_alert"] = False
 
         _save_state_unlocked(st)
-        return st
     finally:
         release_file_lock(STATE_LOCK_PATH, lock_fd)
 
+    threading.Thread(
+        target=_capture_session_ground_truth, name="or-ground-truth", daemon=True,
+    ).start()
+    return st
+
+
+def _capture_session_ground_truth() -> None:
+    """Fetch OpenRouter ground truth and hand it to the supervisor loop as the session baseline.
+
+    The loop does its own unlocked load/modify/save of state, so writing here
+    could be overwritten (or overwrite the loop's fields). The values are queued
+    with mark_state instead and land in the loop's next flush_state_patch.
+    """
+    from supervisor.commands import mark_state
+
+    ground_truth = check_openrouter_ground_truth()
+    if ground_truth is None:
+        # If we can't fetch ground truth, use 0 as baseline
+        mark_state({"session_total_snapshot": 0.0})
+        return
+    mark_state({
+        "session_total_snapshot": ground_truth["total_usd"],
+        "session_spent_snapshot": float(load_state().get("spent_usd") or 0.0),
+        "openrouter_total_usd": ground_truth["total_usd"],
+        "openrouter_daily_usd": ground_truth["daily_usd"],
+        "openrouter_last_check_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    })
+
 
 # ---------------------------------------------------------------------------
 # Budget tracking (moved from workers.py)
@@ -569,14 +634,14 @@ def status_text(workers_dict: Dict[int, Any], pending_list: list, running_dict:
                 f"{t.get('id')}:{t.get('type')}:pr{t.get('priority')}:a{int(t.get('_attempt') or 1)}")
         lines.append("pending_queue: " + ", ".join(preview))
     if running_dict:
-        lines.append("running_ids: " + ", ".join(list(running_dict.keys())[:10]))
+        lines.append("running_ids: " + ", ".join(itertools.islice(running_dict, 10)))
     busy = [f"{getattr(w, 'wid', '?')}:{getattr(w, 'busy_task_id', '?')}"
             for w in workers_dict.values() if getattr(w, 'busy_task_id', None)]
     if busy:
         lines.append("busy: " + ", ".join(busy))
     if running_dict:
         details = []
-        for task_id, meta in list(running_dict.items())[:10]:
+        for task_id, meta in itertools.islice(running_dict.items(), 10):
             task = meta.get("task") if isinstance(meta, dict) else {}
             started = float(meta.get("started_at") or 0.0) if isinstance(meta, dict) else 0.0
             hb = float(meta.get("last_heartbeat_at") or 0.0) if isinstance(meta, dict) else 0.0
@@ -653,9 +718,10 @@ def status_text(workers_dict: Dict[int, Any], pending_list: list, running_dict:
 def rotate_chat_log_if_needed(drive_root: pathlib.Path, max_bytes: int = 800_000) -> None:
     """Rotate chat log if it exceeds max_bytes."""
     chat = drive_root / "logs" / "chat.jsonl"
-    if not chat.exists():
-        return
-    if chat.stat().st_size < max_bytes:
+    try:
+        if chat.stat().st_size < max_bytes:
+            return
+    except FileNotFoundError:
         return
     ts = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d_%H%M%S")
     archive_path = drive_root / "archive" / f"chat_{ts}.jsonl"
@@ -110,11 +110,22 @@ RUNNING: Dict[str, Dict[str, Any]] = {}
 CRASH_TS: List[float] = []
 QUEUE_SEQ_COUNTER_REF: Dict[str, int] = {"value": 0}
 
+# Live-worker count maintained on spawn/reap, so status polls don't issue an
+# is_alive() (waitpid) per worker. Slots in _REAPED_WIDS were already
+# subtracted when their process was found dead.
+_ALIVE_COUNT: int = 0
+_REAPED_WIDS: set = set()
+
 # Lock for all mutations to PENDING, RUNNING, WORKERS shared collections.
 # Canonical definition lives in queue.py; imported here for use by assign_tasks/kill_workers.
 from supervisor.queue import _queue_lock
 
 
+def alive_count() -> int:
+    """Number of worker processes believed alive (no syscalls)."""
+    return _ALIVE_COUNT
+
+
 def get_running_task_ids() -> List[str]:
     """Return list of task IDs currently being processed by workers."""
     return [w.busy_task_id for w in WORKERS.values() if w.busy_task_id]
@@ -424,7 +435,7 @@ def _verify_worker_sha_after_spawn(events_offset: int, timeout_sec: float = 90.0
 
 
 def spawn_workers(n: int = 0) -> None:
-    global _CTX, _EVENT_Q
+    global _CTX, _EVENT_Q, _ALIVE_COUNT
     # Force fresh context to ensure workers use latest code
     _CTX = mp.get_context(_WORKER_START_METHOD)
     _EVENT_Q = _CTX.Queue()
@@ -452,6 +463,8 @@ def spawn_workers(n: int = 0) -> None:
         proc.daemon = True
         proc.start()
         WORKERS[i] = Worker(wid=i, proc=proc, in_q=in_q, busy_task_id=None)
+    _ALIVE_COUNT = len(WORKERS)
+    _REAPED_WIDS.clear()
     global _LAST_SPAWN_TIME
     _LAST_SPAWN_TIME = time.time()
     # Run SHA verification in background to avoid blocking the main loop for up to 90s
@@ -459,6 +472,7 @@ def spawn_workers(n: int = 0) -> None:
 
 
 def kill_workers(force: bool = False) -> None:
+    global _ALIVE_COUNT
     from supervisor import queue
     with _queue_lock:
         cleared_running = len(RUNNING)
@@ -471,6 +485,8 @@ def kill_workers(force: bool = False) -> None:
             _kill_survivors()
         WORKERS.clear()
         RUNNING.clear()
+        _ALIVE_COUNT = 0
+        _REAPED_WIDS.clear()
     queue.persist_queue_snapshot(reason="kill_workers")
     if cleared_running:
         append_jsonl(
@@ -503,13 +519,17 @@ def _kill_survivors() -> None:
 
 
 def respawn_worker(wid: int) -> None:
-    global _LAST_SPAWN_TIME
+    global _LAST_SPAWN_TIME, _ALIVE_COUNT
     ctx = _get_ctx()
     in_q = ctx.Queue()
     proc = ctx.Process(target=worker_main,
                        args=(wid, in_q, get_event_q(), str(REPO_DIR), str(DRIVE_ROOT)))
     proc.daemon = True
     proc.start()
+    # Replacing a live slot (cancel / hard timeout) keeps the count unchanged.
+    if wid not in WORKERS or wid in _REAPED_WIDS:
+        _ALIVE_COUNT += 1
+        _REAPED_WIDS.discard(wid)
     WORKERS[wid] = Worker(wid=wid, proc=proc, in_q=in_q, busy_task_id=None)
     # Give freshly respawned workers the same init grace as startup workers.
     _LAST_SPAWN_TIME = time.time()
@@ -536,7 +556,7 @@ def assign_tasks() -> None:
                     break
                 if chosen_idx is None:
                     # Only over-budget evolution tasks remain — clean them out
-                    PENDING[:] = [t for t in PENDING if str(t.get("type") or "") != "evolution"]
+                    queue.drop_pending_of_type("evolution")
                     queue.persist_queue_snapshot(reason="evolution_dropped_budget")
                     continue
                 task = PENDING.pop(chosen_idx)
@@ -565,6 +585,7 @@ def assign_tasks() -> None:
 # ---------------------------------------------------------------------------
 
 def ensure_workers_healthy() -> None:
+    global _ALIVE_COUNT
     from supervisor import queue
     # Grace period: skip health check right after spawn — workers need time to initialize
     if (time.time() - _LAST_SPAWN_TIME) < _SPAWN_GRACE_SEC:
@@ -574,6 +595,9 @@ def ensure_workers_healthy() -> None:
     for wid, w in list(WORKERS.items()):
         if not w.proc.is_alive():
             dead_detections += 1
+            if wid not in _REAPED_WIDS:
+                _REAPED_WIDS.add(wid)
+                _ALIVE_COUNT = max(0, _ALIVE_COUNT - 1)
             if w.busy_task_id is not None:
                 busy_crashes += 1
             append_jsonl(
@@ -595,7 +619,7 @@ def ensure_workers_healthy() -> None:
             queue.persist_queue_snapshot(reason="worker_respawn_after_crash")
 
     now = time.time()
-    alive_now = sum(1 for w in WORKERS.values() if w.proc.is_alive())
+    alive_now = alive_count()
     if dead_detections:
         # Count only meaningful failures:
         # - any crash while a task was running, or
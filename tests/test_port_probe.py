@@ -0,0 +1,61 @@
+"""
+Tests for the netstat / ss fallbacks in ouroboros.port_probe.
+
+Run: pytest tests/test_port_probe.py -v
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ouroboros.port_probe import _parse_netstat, _parse_ss  # noqa: E402
+
+
+NETSTAT_ANO = """
+Active Connections
+
+  Proto  Local Address          Foreign Address        State           PID
+  TCP    0.0.0.0:135            0.0.0.0:0              LISTENING       1040
+  TCP    127.0.0.1:8765         0.0.0.0:0              LISTENING       4242
+  TCP    127.0.0.1:87650        0.0.0.0:0              LISTENING       5555
+  TCP    [::]:8765              [::]:0                 LISTENING       4343
+  TCP    127.0.0.1:8765         127.0.0.1:50123        TIME_WAIT       0
+  TCP    127.0.0.1:50124        127.0.0.1:8765         ESTABLISHED     7777
+"""
+
+SS_LTNP = """\
+State  Recv-Q Send-Q Local Address:Port  Peer Address:Port Process
+LISTEN 0      4096       127.0.0.1:8765       0.0.0.0:*     users:(("python3",pid=4242,fd=7))
+LISTEN 0      4096       127.0.0.1:87650      0.0.0.0:*     users:(("python3",pid=5555,fd=3))
+LISTEN 0      4096            [::]:8765          [::]:*     users:(("python3",pid=4343,fd=12))
+LISTEN 0      128          0.0.0.0:22         0.0.0.0:*     users:(("sshd",pid=900,fd=3))
+LISTEN 0      128        127.0.0.1:8765       0.0.0.0:*
+"""
+
+
+@pytest.mark.parametrize("port, expected", [
+    (8765, {4242, 4343}),   # IPv4 + IPv6 listeners; TIME_WAIT pid 0 and peer-side row dropped
+    (87650, {5555}),        # :8765 must not match :87650, nor the other way round
+    (135, {1040}),
+    (9999, set()),
+])
+def test_parse_netstat(port, expected):
+    assert _parse_netstat(NETSTAT_ANO, port) == expected
+
+
+@pytest.mark.parametrize("port, expected", [
+    (8765, {4242, 4343}),   # row without a process column is skipped
+    (87650, {5555}),
+    (22, {900}),
+    (9999, set()),
+])
+def test_parse_ss(port, expected):
+    assert _parse_ss(SS_LTNP, port) == expected
+
+
+def test_parse_netstat_drops_pid_zero_only_rows():
+    out = "  TCP    127.0.0.1:8765         127.0.0.1:50123        TIME_WAIT       0\n"
+    assert _parse_netstat(out, 8765) == set()
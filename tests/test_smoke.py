@@ -52,6 +52,7 @@ SUPERVISOR_MODULES = [
     "supervisor.workers",
     "supervisor.git_ops",
     "supervisor.events",
+    "supervisor.commands",
 ]
 
 
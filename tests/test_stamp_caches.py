@@ -0,0 +1,135 @@
+"""
+Tests for stat-stamped caches: settings.json loads and the staged git diff.
+
+Run: pytest tests/test_stamp_caches.py -v
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ouroboros import config  # noqa: E402
+
+
+# ── Settings cache ───────────────────────────────────────────────
+
+@pytest.fixture
+def settings_file(monkeypatch, tmp_path):
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(config, "SETTINGS_PATH", path)
+    monkeypatch.setattr(config, "_SETTINGS_LOCK", tmp_path / "settings.json.lock")
+    monkeypatch.setattr(config, "_settings_cache", None)
+    return path
+
+
+def _rewrite(path, data, bump_ns=1_000_000_000):
+    """Replace the file and push its mtime forward so the stamp changes."""
+    st = path.stat()
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+
+
+def test_save_primes_cache(settings_file, monkeypatch):
+    config.save_settings({"OUROBOROS_MODEL": "m1"})
+
+    def _no_parse(_raw):
+        raise AssertionError("load after save should be served from the cache")
+
+    monkeypatch.setattr(config, "_loads_settings", _no_parse)
+    loaded = config.load_settings()
+    assert loaded["OUROBOROS_MODEL"] == "m1"
+    assert loaded["TOTAL_BUDGET"] == config.SETTINGS_DEFAULTS["TOTAL_BUDGET"]
+
+
+def test_rewrite_invalidates_cache(settings_file):
+    config.save_settings({"OUROBOROS_MODEL": "m1"})
+    assert config.load_settings()["OUROBOROS_MODEL"] == "m1"
+    _rewrite(settings_file, {"OUROBOROS_MODEL": "m2-longer"})
+    assert config.load_settings()["OUROBOROS_MODEL"] == "m2-longer"
+
+
+def test_same_size_rewrite_invalidates_cache(settings_file):
+    config.save_settings({"OUROBOROS_MODEL": "aa"})
+    config.load_settings()
+    _rewrite(settings_file, {"OUROBOROS_MODEL": "bb"})
+    assert config.load_settings()["OUROBOROS_MODEL"] == "bb"
+
+
+def test_cached_load_returns_copy(settings_file):
+    config.save_settings({"OUROBOROS_MODEL": "m1"})
+    first = config.load_settings()
+    first["OUROBOROS_MODEL"] = "mutated"
+    assert config.load_settings()["OUROBOROS_MODEL"] == "m1"
+
+
+def test_missing_file_gives_defaults(settings_file):
+    assert config.load_settings() == config.SETTINGS_DEFAULTS
+
+
+# ── Staged-diff cache ────────────────────────────────────────────
+
+def _git(repo, *args):
+    import subprocess
+    subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        cwd=str(repo), check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    import shutil
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    _git(tmp_path, "add", "a.py")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def test_staged_diff_key_stable_without_changes(repo):
+    from ouroboros.tools.git import _staged_diff_key
+    assert _staged_diff_key(repo) == _staged_diff_key(repo)
+
+
+def test_staged_diff_key_changes_after_same_size_add(repo):
+    from ouroboros.tools.git import _staged_diff_key
+    (repo / "a.py").write_text("x = 2\n", encoding="utf-8")
+    _git(repo, "add", "a.py")
+    index = repo / ".git" / "index"
+    st = index.stat()
+    before = _staged_diff_key(repo)
+
+    (repo / "a.py").write_text("x = 3\n", encoding="utf-8")
+    _git(repo, "add", "a.py")
+    # Simulate a coarse-mtime filesystem: same size, same mtime as before.
+    assert index.stat().st_size == st.st_size
+    os.utime(index, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert _staged_diff_key(repo) != before
+
+
+def test_staged_diff_key_changes_after_commit(repo):
+    from ouroboros.tools.git import _staged_diff_key
+    (repo / "a.py").write_text("x = 2\n", encoding="utf-8")
+    _git(repo, "add", "a.py")
+    before = _staged_diff_key(repo)
+    _git(repo, "commit", "-q", "-m", "second")
+    assert _staged_diff_key(repo) != before
+
+
+def test_git_diff_staged_not_stale(repo):
+    import types
+    from ouroboros.tools import git as git_tools
+    ctx = types.SimpleNamespace(repo_dir=repo)
+    (repo / "a.py").write_text("x = 2\n", encoding="utf-8")
+    _git(repo, "add", "a.py")
+    assert "+x = 2" in git_tools._git_diff(ctx, staged=True)
+    (repo / "a.py").write_text("x = 3\n", encoding="utf-8")
+    _git(repo, "add", "a.py")
+    assert "+x = 3" in git_tools._git_diff(ctx, staged=True)
@@ -0,0 +1,210 @@
+"""
+Tests for supervisor helpers: slash-command parsing and dispatch.
+
+Run: pytest tests/test_supervisor.py -v
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from supervisor import commands  # noqa: E402
+
+
+# ── Slash commands ───────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def _clear_state_patch():
+    yield
+    commands._state_patch.clear()
+    commands._state_patch_defaults.clear()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("/status", ("/status", "")),
+    ("/evolve off", ("/evolve", "off")),
+    ("/BG  start now", ("/bg", "start now")),
+    ("   /review\t", ("/review", "")),
+    ("\n/evolve On\n", ("/evolve", "On")),
+    ("hello /status", None),
+    ("status", None),
+    ("", None),
+    ("   ", None),
+])
+def test_parse_command(text, expected):
+    assert commands._parse_command(text) == expected
+
+
+def _owner_ctx(state):
+    saved = []
+
+    def save_state(st):
+        state.clear()
+        state.update(st)
+        saved.append(dict(st))
+
+    return types.SimpleNamespace(load_state=lambda: dict(state), save_state=save_state), saved
+
+
+def _dispatch(monkeypatch, text, state):
+    import supervisor.message_bus as message_bus
+    monkeypatch.setattr(message_bus, "log_chat", lambda *a, **k: None)
+    calls = []
+    monkeypatch.setitem(
+        commands.SUPERVISOR_COMMANDS, "/status",
+        lambda ctx, chat_id, args: calls.append((chat_id, args, ctx.load_state().get("owner_chat_id"))),
+    )
+    ctx, _ = _owner_ctx(state)
+    commands.handle_owner_update({"message": {"text": text}}, ctx, now_iso="2026-01-01T00:00:00+00:00")
+    return calls
+
+
+def test_command_dispatch_lowercases_args(monkeypatch):
+    calls = _dispatch(monkeypatch, "  /STATUS Verbose ALL", {})
+    assert len(calls) == 1
+    assert calls[0][:2] == (1, ["verbose", "all"])
+
+
+def test_command_sees_owner_ids_on_fresh_state(monkeypatch):
+    # Owner defaults are flushed before the handler runs (/review needs owner_chat_id).
+    calls = _dispatch(monkeypatch, "/status", {})
+    assert calls[0][2] == 1
+
+
+def test_unknown_command_is_not_dispatched(monkeypatch):
+    import supervisor.workers as workers
+    routed = []
+    monkeypatch.setattr(workers, "_get_chat_agent",
+                        lambda: types.SimpleNamespace(_busy=True, inject_message=routed.append))
+    state = {}
+    ctx, _ = _owner_ctx(state)
+    ctx.consciousness = types.SimpleNamespace(inject_observation=lambda _t: None)
+    import supervisor.message_bus as message_bus
+    monkeypatch.setattr(message_bus, "log_chat", lambda *a, **k: None)
+    commands.handle_owner_update({"message": {"text": "/nosuch thing"}}, ctx)
+    assert routed == ["/nosuch thing"]
+
+
+# ── Pending-queue pruning ────────────────────────────────────────
+
+@pytest.fixture
+def pending(monkeypatch):
+    from supervisor import queue
+    tasks = []
+    monkeypatch.setattr(queue, "PENDING", tasks)
+    return tasks
+
+
+def test_prune_pending_keeps_order_and_list_identity(pending):
+    from supervisor import queue
+    pending.extend({"id": str(i), "type": "evolution" if i % 3 == 0 else "task"} for i in range(10))
+    same_list = pending
+    removed = queue.prune_pending(lambda t: t["type"] != "evolution")
+    assert removed == 4
+    assert queue.PENDING is same_list
+    assert [t["id"] for t in pending] == ["1", "2", "4", "5", "7", "8"]
+
+
+def test_prune_pending_stable_for_equal_tasks(pending):
+    from supervisor import queue
+    a, b, c = {"id": "x", "type": "task"}, {"id": "x", "type": "task"}, {"id": "y", "type": "review"}
+    pending.extend([a, c, b])
+    assert queue.prune_pending(lambda t: t["type"] == "task") == 1
+    assert pending[0] is a and pending[1] is b
+
+
+@pytest.mark.parametrize("keep, expected_left", [
+    (lambda t: True, 3),
+    (lambda t: False, 0),
+])
+def test_prune_pending_all_or_nothing(pending, keep, expected_left):
+    from supervisor import queue
+    pending.extend({"id": str(i), "type": "task"} for i in range(3))
+    assert queue.prune_pending(keep) == 3 - expected_left
+    assert len(pending) == expected_left
+
+
+def test_drop_pending_of_type(pending):
+    from supervisor import queue
+    pending.extend([{"id": "1", "type": "evolution"}, {"id": "2"}, {"id": "3", "type": "evolution"}])
+    assert queue.drop_pending_of_type("evolution") == 2
+    assert [t["id"] for t in pending] == ["2"]
+
+
+# ── Live-worker bookkeeping ──────────────────────────────────────
+
+class _FakeProc:
+    def __init__(self, *args, **kwargs):
+        self.alive = False
+        self.daemon = False
+        self.pid = None
+        self.exitcode = None
+
+    def start(self):
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def terminate(self):
+        self.alive = False
+
+    def join(self, timeout=None):
+        return None
+
+
+@pytest.fixture
+def fake_workers(monkeypatch, tmp_path):
+    from supervisor import queue, workers
+    fake_ctx = types.SimpleNamespace(Queue=lambda *a, **k: object(), Process=_FakeProc)
+    monkeypatch.setattr(workers, "_get_ctx", lambda: fake_ctx)
+    monkeypatch.setattr(workers, "_EVENT_Q", object())
+    monkeypatch.setattr(workers, "DRIVE_ROOT", tmp_path)
+    monkeypatch.setattr(workers, "_LAST_SPAWN_TIME", 0.0)
+    monkeypatch.setattr(workers, "WORKERS", {})
+    monkeypatch.setattr(workers, "_ALIVE_COUNT", 0)
+    monkeypatch.setattr(workers, "_REAPED_WIDS", set())
+    monkeypatch.setattr(workers, "CRASH_TS", [])
+    monkeypatch.setattr(queue, "RUNNING", {})
+    monkeypatch.setattr(queue, "persist_queue_snapshot", lambda **kw: None)
+    for wid in range(3):
+        workers.respawn_worker(wid)
+    monkeypatch.setattr(workers, "_LAST_SPAWN_TIME", 0.0)  # past the spawn grace
+    return workers
+
+
+def test_alive_count_after_initial_spawn(fake_workers):
+    assert fake_workers.alive_count() == 3
+
+
+def test_alive_count_after_reap_then_respawn(fake_workers):
+    fake_workers.WORKERS[1].proc.alive = False
+    fake_workers.ensure_workers_healthy()
+    assert fake_workers.alive_count() == 3
+    assert fake_workers.WORKERS[1].proc.is_alive()
+    assert not fake_workers._REAPED_WIDS
+    # A second pass over an already-healthy pool must not double count.
+    fake_workers.ensure_workers_healthy()
+    assert fake_workers.alive_count() == 3
+
+
+def test_alive_count_after_cancel_respawn(fake_workers):
+    from supervisor import queue
+    w = fake_workers.WORKERS[2]
+    w.busy_task_id = "t1"
+    queue.RUNNING["t1"] = {"task": {"id": "t1"}, "worker_id": 2}
+    assert queue.cancel_task_by_id("t1") is True
+    # Replacing a live slot keeps the count unchanged.
+    assert fake_workers.alive_count() == 3
+    assert fake_workers.WORKERS[2].proc is not w.proc
+
+
+def test_alive_count_after_kill(fake_workers):
+    fake_workers.kill_workers()
+    assert fake_workers.alive_count() == 0
+    fake_workers.respawn_worker(0)
+    assert fake_workers.alive_count() == 1